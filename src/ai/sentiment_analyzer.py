@@ -36,3 +36,29 @@ class SentimentAnalyzer:
             'neutral': neutral_prob,
             'negative': negative_prob
         }
+
+    def analyze_batch(self, texts):
+        """Analyze sentiment of several texts in a single padded forward pass"""
+        if not texts:
+            return []
+
+        inputs = self.tokenizer(list(texts), return_tensors="pt", truncation=True, max_length=512, padding=True)
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+        predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+
+        # Composite score for every row at once: 0 = very negative, 0.5 = neutral, 1 = very positive
+        scores = ((predictions[:, 0] - predictions[:, 2] + 1) / 2).tolist()
+        label_indices = predictions.argmax(dim=-1).tolist()
+
+        return [
+            {
+                'label': self.labels[label_index],
+                'score': score,
+                'positive': positive_prob,
+                'neutral': neutral_prob,
+                'negative': negative_prob
+            }
+            for label_index, score, (positive_prob, neutral_prob, negative_prob)
+            in zip(label_indices, scores, predictions.tolist())
+        ]
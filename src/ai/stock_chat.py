@@ -4,21 +4,37 @@ A conversational AI that educates users about investing, provides resources,
 and guides ethical investment decisions. Acts as a knowledgeable mentor rather
 than just a technical analysis tool.
 """
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from transformers import pipeline
 import torch
 import re
 
 class StockChatAssistant:
-    def __init__(self):
-        """Initialize the chat assistant with Q&A model"""
-        self.qa_pipeline = None
-        self.initialized = False
+    # Max tickers whose parsed context is kept for switching back (LRU)
+    CONTEXT_CACHE_SIZE = 8
+    # Switching back restores a ticker's context only while its analysis is this fresh
+    # (market data moves; the sentiment cache refreshes on the same 15 minutes)
+    CONTEXT_TTL = timedelta(minutes=15)
+    
+    def __init__(self, qa_pipeline=None):
+        """
+        Initialize the chat assistant with Q&A model
+        
+        Args:
+            qa_pipeline: Optional question-answering callable used instead of loading
+                DistilBERT (e.g. a lightweight fake in tests)
+        """
+        self.qa_pipeline = qa_pipeline
+        self.initialized = qa_pipeline is not None
         self.conversation_history = []  # Track conversation for context
         
         # Conversation memory for follow-up questions
         self.last_ticker = None
         self.last_analysis_context = None
         self.last_analysis_time = None
+        # Parsed context per ticker: {ticker: (context, data, parsed_at)} so follow-ups skip re-parsing
+        self._context_cache = OrderedDict()
         
         # Financial Advisor Persona
         self.system_persona = """
@@ -165,12 +181,14 @@ and always emphasize risk management and due diligence.
             # Use last analysis context if current context is empty
             if not context or len(context.strip()) < 50:
                 context = self.last_analysis_context or context
+        elif ticker and (not context or len(context.strip()) < 50):
+            # Switching back to a recently discussed ticker: restore its context if still fresh
+            context = self._fresh_cached_context(ticker) or context
         
         # Store context for future follow-up questions
         if ticker and context and len(context.strip()) > 50:
             self.last_ticker = ticker
             self.last_analysis_context = context
-            from datetime import datetime
             self.last_analysis_time = datetime.now()
         
         # Check if this is a non-financial question
@@ -371,8 +389,8 @@ and always emphasize risk management and due diligence.
         
         # Parse context to extract key data points for stock-specific questions
         try:
-            # Extract data from context string
-            data = self._parse_context_data(context)
+            # Extract data from context string (reused across follow-up turns)
+            data = self._get_context_data(context, ticker)
         except:
             data = {}
         
@@ -413,6 +431,27 @@ and always emphasize risk management and due diligence.
         
         return response
     
+    def _get_context_data(self, context, ticker):
+        """Return parsed context data, parsing only when the ticker's context changed"""
+        cached = self._context_cache.get(ticker)
+        if cached and cached[0] == context:
+            self._context_cache.move_to_end(ticker)
+            return cached[1]
+        
+        data = self._parse_context_data(context)
+        self._context_cache[ticker] = (context, data, datetime.now())
+        self._context_cache.move_to_end(ticker)
+        if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
+        return data
+    
+    def _fresh_cached_context(self, ticker):
+        """Cached context for the ticker, or None if there is none or it is older than CONTEXT_TTL"""
+        cached = self._context_cache.get(ticker)
+        if cached and datetime.now() - cached[2] < self.CONTEXT_TTL:
+            return cached[0]
+        return None
+    
     def _parse_context_data(self, context):
         """Extract structured data from context string"""
         data = {}
@@ -88,7 +88,9 @@ class PortfolioAnalyzer:
             # Get currency from yfinance (CRITICAL: prices are already in this currency)
             try:
                 stock = yf.Ticker(ticker)
-                price_currency = stock.info.get('currency', 'USD')  # Fallback to USD if not found
+                # fast_info takes the currency from the chart metadata, which reports the same
+                # quote currency as the full .info scrape; .info is only fetched when it's missing
+                price_currency = stock.fast_info.get('currency') or stock.info.get('currency', 'USD')  # Fallback to USD if not found
             except:
                 price_currency = 'USD'
             result['price_currency'] = price_currency
@@ -103,8 +105,8 @@ class PortfolioAnalyzer:
             
             if news_articles:
                 print(f"  📰 Analyzing {len(news_articles)} news articles...")
-                for article in news_articles:
-                    sentiment = self.sentiment_analyzer.analyze(article['title'])
+                sentiments = self.sentiment_analyzer.analyze_batch([article['title'] for article in news_articles])
+                for article, sentiment in zip(news_articles, sentiments):
                     sentiment['title'] = article['title']
                     sentiment['link'] = article.get('link', '')
                     sentiment['publisher'] = article.get('publisher', 'Unknown')
@@ -321,8 +323,10 @@ class PortfolioAnalyzer:
                 # Only 1 candle - fetch previous close for daily change
                 try:
                     stock = yf.Ticker(ticker)
-                    info = stock.info
-                    previous_close = info.get('previousClose')
+                    # Regular-session close, as info['previousClose'] reported; fast_info's
+                    # previousClose is derived from pre/post-market hourly bars instead
+                    previous_close = (stock.fast_info.get('regularMarketPreviousClose')
+                                      or stock.info.get('previousClose'))
                     if previous_close and previous_close > 0:
                         price_change = ((current_price - previous_close) / previous_close) * 100
                     else:
@@ -81,27 +81,7 @@ class SocialMediaFetcher:
             if response.status_code == 200:
                 data = response.json()
                 
-                if 'messages' in data:
-                    for msg in data['messages'][:max_messages]:
-                        # Extract message data
-                        message_id = msg.get('id', '')
-                        message_data = {
-                            'text': msg.get('body', ''),
-                            'created_at': msg.get('created_at', ''),
-                            'source': 'StockTwits',
-                            'user': msg.get('user', {}).get('username', 'Unknown'),
-                            # Construct link to the post
-                            'link': f'https://stocktwits.com/message/{message_id}' if message_id else ''
-                        }
-                        
-                        # StockTwits sometimes includes user sentiment tags
-                        if 'entities' in msg and 'sentiment' in msg['entities']:
-                            sentiment = msg['entities']['sentiment']
-                            if sentiment:
-                                message_data['user_sentiment'] = sentiment.get('basic', 'Unknown')
-                        
-                        messages.append(message_data)
-                        
+                messages = self._parse_stocktwits_messages(data, max_messages)
                 print(f"✓ Fetched {len(messages)} StockTwits messages for {ticker}")
             else:
                 print(f"⚠️  StockTwits API returned status {response.status_code} for {ticker}")
@@ -120,6 +100,33 @@ class SocialMediaFetcher:
         
         return messages
     
+    @staticmethod
+    def _parse_stocktwits_messages(data, max_messages):
+        """
+        Convert a StockTwits /streams/symbol JSON payload into message dicts
+        Shared by the plain HTTP fetch and the Selenium fallback
+        """
+        messages = []
+        for msg in data.get('messages', [])[:max_messages]:
+            message_id = msg.get('id', '')
+            message_data = {
+                'text': msg.get('body', ''),
+                'created_at': msg.get('created_at', ''),
+                'source': 'StockTwits',
+                'user': msg.get('user', {}).get('username', 'Unknown'),
+                # Construct link to the post
+                'link': f'https://stocktwits.com/message/{message_id}' if message_id else ''
+            }
+            
+            # StockTwits sometimes includes user sentiment tags
+            if 'entities' in msg and 'sentiment' in msg['entities']:
+                sentiment = msg['entities']['sentiment']
+                if sentiment:
+                    message_data['user_sentiment'] = sentiment.get('basic', 'Unknown')
+            
+            messages.append(message_data)
+        return messages
+    
     def fetch_stocktwits_with_selenium(self, ticker, max_messages=30):
         """
         Fetch StockTwits messages using Selenium headless browser to bypass Cloudflare
@@ -172,24 +179,7 @@ class SocialMediaFetcher:
                 data = json.loads(page_text)
                 
                 if 'messages' in data:
-                    for msg in data['messages'][:max_messages]:
-                        message_id = msg.get('id', '')
-                        message_data = {
-                            'text': msg.get('body', ''),
-                            'created_at': msg.get('created_at', ''),
-                            'source': 'StockTwits',
-                            'user': msg.get('user', {}).get('username', 'Unknown'),
-                            'link': f'https://stocktwits.com/message/{message_id}' if message_id else ''
-                        }
-                        
-                        # StockTwits sometimes includes user sentiment tags
-                        if 'entities' in msg and 'sentiment' in msg['entities']:
-                            sentiment = msg['entities']['sentiment']
-                            if sentiment:
-                                message_data['user_sentiment'] = sentiment.get('basic', 'Unknown')
-                        
-                        messages.append(message_data)
-                    
+                    messages = self._parse_stocktwits_messages(data, max_messages)
                     print(f"✓ Fetched {len(messages)} StockTwits messages for {ticker} (via Selenium)")
                 else:
                     print(f"⚠️  No messages found in StockTwits response for {ticker}")
@@ -5,6 +5,9 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from .helpers import format_timeframe_display
 
+# Name of the "insufficient data" note, whose color depends on the theme
+INFO_ANNOTATION = 'info'
+
 class ChartGenerator:
     @staticmethod
     def create_candlestick_chart(ticker, df, indicators, chart_type='candlestick', timeframe='3mo', theme='dark'):
@@ -318,9 +321,6 @@ class ChartGenerator:
                 fig.add_hline(y=30, line_dash="dash", line_color="green",
                              annotation_text="Oversold", row=current_row, col=1)
         
-        # Configure theme colors early for annotations
-        annotation_color = '#adb5bd' if theme == 'dark' else '#6c757d'
-        
         # Adjust height based on number of rows
         if not has_indicators:
             chart_height = 500 if chart_type != 'volume' else 600
@@ -331,8 +331,9 @@ class ChartGenerator:
                     xref="paper", yref="paper",
                     x=0.5, y=-0.1,
                     showarrow=False,
-                    font=dict(size=12, color=annotation_color),
-                    align="center"
+                    font=dict(size=12),
+                    align="center",
+                    name=INFO_ANNOTATION  # colored by apply_theme
                 )
         else:
             # Calculate based on number of rows
@@ -387,44 +388,59 @@ class ChartGenerator:
                 'tickangle': -45
             }
         
+        fig.update_layout(
+            height=chart_height,
+            showlegend=True,
+            xaxis_rangeslider_visible=False,
+            hovermode='x unified',
+            font=dict(size=10),
+            # Remove template - set colors explicitly instead
+        )
+        
+        # Apply custom x-axis formatting to all subplots
+        fig.update_xaxes(**xaxis_format)
+        
+        ChartGenerator.apply_theme(fig, theme)
+        
+        return fig
+    
+    @staticmethod
+    def apply_theme(fig, theme='dark'):
+        """Apply theme colors to an existing chart (cheap; no trace rebuild)
+        
+        Args:
+            fig: Plotly figure from create_candlestick_chart
+            theme: Chart theme ('dark' or 'light')
+        """
         # Configure theme-based styling
         if theme == 'dark':
             grid_color = 'rgba(128,128,128,0.2)'
             paper_bgcolor = '#111111'
             plot_bgcolor = '#111111'
             font_color = '#e0e0e0'
+            annotation_color = '#adb5bd'
         else:
             grid_color = 'rgba(128,128,128,0.2)'
             paper_bgcolor = '#ffffff'
             plot_bgcolor = '#ffffff'
             font_color = '#000000'
+            annotation_color = '#6c757d'
         
         fig.update_layout(
-            height=chart_height,
-            showlegend=True,
-            xaxis_rangeslider_visible=False,
-            hovermode='x unified',
-            font=dict(size=10, color=font_color),
+            font=dict(color=font_color),
             paper_bgcolor=paper_bgcolor,
             plot_bgcolor=plot_bgcolor,
-            # Remove template - set colors explicitly instead
         )
         
         print(f"     ✅ Layout updated: paper_bgcolor={paper_bgcolor}, plot_bgcolor={plot_bgcolor}, font_color={font_color}")
         
-        # Apply custom x-axis formatting to all subplots
-        fig.update_xaxes(
-            showgrid=True, 
-            gridwidth=1, 
-            gridcolor=grid_color,
-            linecolor=font_color if theme == 'dark' else '#000000',
-            **xaxis_format
-        )
-        fig.update_yaxes(
+        axis_style = dict(
             showgrid=True, 
             gridwidth=1, 
             gridcolor=grid_color,
             linecolor=font_color if theme == 'dark' else '#000000'
         )
-        
+        fig.update_xaxes(**axis_style)
+        fig.update_yaxes(**axis_style)
+        fig.update_annotations(font_color=annotation_color, selector=dict(name=INFO_ANNOTATION))
         return fig
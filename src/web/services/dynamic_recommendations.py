@@ -2,8 +2,11 @@
 Dynamic Stock Recommendations Service
 Gets live stock recommendations based on real-time market data, not hardcoded lists.
 """
+import copy
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import yfinance as yf
 import requests
@@ -16,6 +19,9 @@ class DynamicRecommendationService:
     Generate stock recommendations dynamically from live market data.
     NO hardcoded stock lists - all recommendations based on real-time analysis.
     """
+    # Scored recommendations are reused for a few minutes (LRU-bounded)
+    RECOMMENDATION_CACHE_SIZE = 256
+    RECOMMENDATION_CACHE_TTL = timedelta(minutes=5)
     
     def __init__(self):
         # Sector ETFs to analyze for constituents
@@ -37,6 +43,21 @@ class DynamicRecommendationService:
         self.finnhub_client = None
         self.alpha_vantage_key = None
         self._init_api_clients()
+        
+        # (method, ticker, headlines) -> (computed_at, result)
+        self._recommendation_cache = OrderedDict()
+        # Flask serves requests on several threads; guards every read/write of the cache
+        self._recommendation_cache_lock = threading.Lock()
+        
+        # Headline model, loaded on first use and reused across recommendations
+        self._headline_sentiment_service = None
+    
+    def _get_headline_sentiment_service(self):
+        """Lazy load the headline sentiment service"""
+        if self._headline_sentiment_service is None:
+            from src.web.services.headline_sentiment_service import HeadlineSentimentService
+            self._headline_sentiment_service = HeadlineSentimentService()
+        return self._headline_sentiment_service
     
     def _init_api_clients(self):
         """Initialize API clients for live data"""
@@ -653,6 +674,13 @@ class DynamicRecommendationService:
         Returns:
             Dict with total_score, component scores, sentiment analysis, and confidence
         """
+        return self._cached_recommendation(
+            'sentiment', ticker, headlines,
+            lambda: self._compute_recommendation_with_sentiment(ticker, headlines)
+        )
+    
+    def _compute_recommendation_with_sentiment(self, ticker: str, headlines: List[str]) -> Optional[Dict]:
+        """Uncached body of get_recommendation_with_sentiment"""
         try:
             # Get technical + fundamental scores
             base_result = self.get_consolidated_score(ticker)
@@ -660,8 +688,7 @@ class DynamicRecommendationService:
                 return None
             
             # Get sentiment from headlines
-            from src.web.services.headline_sentiment_service import HeadlineSentimentService
-            sentiment_service = HeadlineSentimentService()
+            sentiment_service = self._get_headline_sentiment_service()
             
             if headlines:
                 sentiment_score = sentiment_service.get_sentiment_score_for_stock(ticker, headlines)
@@ -748,6 +775,13 @@ class DynamicRecommendationService:
         - "Market is volatile" (VIX > 25)
         - "Insufficient headline data"
         """
+        return self._cached_recommendation(
+            'confidence', ticker, headlines,
+            lambda: self._compute_recommendation_with_confidence(ticker, headlines)
+        )
+    
+    def _compute_recommendation_with_confidence(self, ticker: str, headlines: List[str]) -> Optional[Dict]:
+        """Uncached body of get_recommendation_with_confidence"""
         try:
             # Get sentiment-weighted recommendation
             rec_with_sentiment = self.get_recommendation_with_sentiment(ticker, headlines)
@@ -906,6 +940,31 @@ class DynamicRecommendationService:
             logger.warning(f"Failed to get confidence analysis for {ticker}: {e}")
             return None
     
+    def _cached_recommendation(self, kind: str, ticker: str, headlines: List[str],
+                               compute: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Return a fresh copy of a recently computed recommendation, or compute and cache it.
+        Failed computations (None) are not cached so the next call retries.
+        The lock covers lookup and insert only; the slow computation runs outside it.
+        """
+        key = (kind, ticker, tuple(headlines or ()))
+        now = datetime.now()
+        
+        with self._recommendation_cache_lock:
+            entry = self._recommendation_cache.get(key)
+            if entry is not None and now - entry[0] < self.RECOMMENDATION_CACHE_TTL:
+                self._recommendation_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+        
+        result = compute()
+        if result is not None:
+            with self._recommendation_cache_lock:
+                self._recommendation_cache[key] = (now, result)
+                self._recommendation_cache.move_to_end(key)
+                if len(self._recommendation_cache) > self.RECOMMENDATION_CACHE_SIZE:
+                    self._recommendation_cache.popitem(last=False)
+        return copy.deepcopy(result)
+    
     def _analyze_stock_live(self, ticker: str) -> Optional[Dict]:
         """
         Perform live technical analysis on a stock:
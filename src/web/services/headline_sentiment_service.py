@@ -1,4 +1,6 @@
+import copy
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional
 from transformers import pipeline
 
@@ -6,9 +8,14 @@ logger = logging.getLogger(__name__)
 
 
 class HeadlineSentimentService:
+    # Distinct headline lists whose batch analysis is kept
+    BATCH_CACHE_SIZE = 512
+    
     def __init__(self):
         self.sentiment_pipeline = None
         self._init_sentiment_model()
+        # Per instance, so the cache never outlives the pipeline that produced it
+        self._analyze_batch_cached = lru_cache(maxsize=self.BATCH_CACHE_SIZE)(self._analyze_headlines_batch)
     
     def _init_sentiment_model(self):
         try:
@@ -52,6 +59,10 @@ class HeadlineSentimentService:
             return None
     
     def analyze_headlines_batch(self, headlines: List[str]) -> Dict:
+        # The same headline list is only run through the model once
+        return copy.deepcopy(self._analyze_batch_cached(tuple(headlines or ())))
+    
+    def _analyze_headlines_batch(self, headlines: tuple) -> Dict:
         if not headlines:
             return {
                 'results': [],
@@ -4,6 +4,7 @@ Market Sentiment Service - Daily market analysis and recommendations
 import os
 import json
 import logging
+import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import yfinance as yf
@@ -29,11 +30,45 @@ except ImportError as e:
     DYNAMIC_RECS_AVAILABLE = False
     logger.warning(f"Dynamic recommendations not available: {e}")
 
+# msgpack is optional: faster cache encoding, JSON is used when it's missing
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Stock recommendations by sector
+SECTOR_STOCKS = {
+    'Technology': ['AAPL', 'MSFT', 'NVDA', 'GOOGL', 'META', 'AMD', 'INTC', 'CRM', 'ORCL', 'ADBE'],
+    'Financials': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'V', 'MA', 'AXP', 'BLK'],
+    'Healthcare': ['JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'ABT', 'DHR', 'MRK', 'BMY', 'AMGN'],
+    'Energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX', 'VLO', 'OXY', 'HAL'],
+    'Industrials': ['BA', 'HON', 'UNP', 'UPS', 'CAT', 'LMT', 'RTX', 'GE', 'MMM', 'DE'],
+    'Consumer Discretionary': ['AMZN', 'TSLA', 'HD', 'MCD', 'NKE', 'SBUX', 'TGT', 'LOW', 'TJX', 'BKNG'],
+    'Consumer Staples': ['WMT', 'PG', 'KO', 'PEP', 'COST', 'PM', 'MDLZ', 'CL', 'MO', 'KMB'],
+    'Materials': ['LIN', 'APD', 'SHW', 'FCX', 'NEM', 'ECL', 'DD', 'DOW', 'NUE', 'VMC'],
+    'Real Estate': ['AMT', 'PLD', 'CCI', 'EQIX', 'PSA', 'O', 'WELL', 'DLR', 'SPG', 'AVB'],
+    'Utilities': ['NEE', 'DUK', 'SO', 'D', 'AEP', 'EXC', 'SRE', 'PEG', 'XEL', 'ED']
+}
+
+
+# Price buckets used by the recommendation price filter
+PRICE_RANGES = {
+    '1-5': (1, 5),
+    '5-10': (5, 10),
+    '10-25': (10, 25),
+    '25-100': (25, 100),
+    '100+': (100, float('inf'))
+}
+
+
 class MarketSentimentService:
     """Service for generating market sentiment and recommendations"""
     
     def __init__(self):
-        self.cache_file = 'cache/market_sentiment_cache.json'
+        self.cache_file = 'cache/market_sentiment_cache.msgpack' if MSGPACK_AVAILABLE else 'cache/market_sentiment_cache.json'
+        # JSON cache from before the msgpack switch, read only while no msgpack cache exists
+        self.legacy_cache_file = 'cache/market_sentiment_cache.json'
         self.cache_duration_hours = 0.25  # Refresh every 15 minutes (markets are volatile!)
         
         # Exchange rates (fallback values, should fetch live)
@@ -44,18 +79,7 @@ class MarketSentimentService:
         }
         
         # Stock recommendations by sector
-        self.sector_stocks = {
-            'Technology': ['AAPL', 'MSFT', 'NVDA', 'GOOGL', 'META', 'AMD', 'INTC', 'CRM', 'ORCL', 'ADBE'],
-            'Financials': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'V', 'MA', 'AXP', 'BLK'],
-            'Healthcare': ['JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'ABT', 'DHR', 'MRK', 'BMY', 'AMGN'],
-            'Energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX', 'VLO', 'OXY', 'HAL'],
-            'Industrials': ['BA', 'HON', 'UNP', 'UPS', 'CAT', 'LMT', 'RTX', 'GE', 'MMM', 'DE'],
-            'Consumer Discretionary': ['AMZN', 'TSLA', 'HD', 'MCD', 'NKE', 'SBUX', 'TGT', 'LOW', 'TJX', 'BKNG'],
-            'Consumer Staples': ['WMT', 'PG', 'KO', 'PEP', 'COST', 'PM', 'MDLZ', 'CL', 'MO', 'KMB'],
-            'Materials': ['LIN', 'APD', 'SHW', 'FCX', 'NEM', 'ECL', 'DD', 'DOW', 'NUE', 'VMC'],
-            'Real Estate': ['AMT', 'PLD', 'CCI', 'EQIX', 'PSA', 'O', 'WELL', 'DLR', 'SPG', 'AVB'],
-            'Utilities': ['NEE', 'DUK', 'SO', 'D', 'AEP', 'EXC', 'SRE', 'PEG', 'XEL', 'ED']
-        }
+        self.sector_stocks = SECTOR_STOCKS
         
     def get_market_indices_data(self) -> Dict:
         """Fetch current data for major market indices using MULTI-SOURCE or intraday data"""
@@ -933,11 +957,16 @@ class MarketSentimentService:
     def load_cache(self) -> Optional[Dict]:
         """Load cached sentiment if still valid (expires daily or after set hours)"""
         try:
-            if not os.path.exists(self.cache_file):
+            if os.path.exists(self.cache_file):
+                cache_file, use_msgpack = self.cache_file, MSGPACK_AVAILABLE
+            elif os.path.exists(self.legacy_cache_file):
+                cache_file, use_msgpack = self.legacy_cache_file, False
+            else:
                 return None
                 
-            with open(self.cache_file, 'r') as f:
-                cache = json.load(f)
+            with open(cache_file, 'rb') as f:
+                raw = f.read()
+            cache = msgpack.unpackb(raw, raw=False) if use_msgpack else json.loads(raw)
             
             cached_time = datetime.fromisoformat(cache.get('timestamp', ''))
             now = datetime.now()
@@ -968,29 +997,39 @@ class MarketSentimentService:
                 'timestamp': datetime.now().isoformat(),
                 'data': data
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache, f, indent=2)
+            if MSGPACK_AVAILABLE:
+                payload = msgpack.packb(cache, use_bin_type=True)
+            else:
+                payload = json.dumps(cache, indent=2).encode('utf-8')
+            
+            # Write to a per-writer temp file and swap it in, so a crash never leaves a partial
+            # cache and concurrent writers (e.g. parallel test workers) don't clobber each other
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(self.cache_file), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
             logger.info("Market sentiment cached successfully")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
     
+    def clear_cache(self):
+        """Drop the cached sentiment so the next request fetches live data"""
+        for cache_file in (self.cache_file, self.legacy_cache_file):
+            try:
+                os.remove(cache_file)
+            except FileNotFoundError:
+                pass
+    
     def _filter_by_price_range(self, recommendations: List[Dict], price_range: str) -> List[Dict]:
         """Filter recommendations by price range"""
-        if price_range == 'all' or not recommendations:
-            return recommendations
-        
-        ranges = {
-            '1-5': (1, 5),
-            '5-10': (5, 10),
-            '10-25': (10, 25),
-            '25-100': (25, 100),
-            '100+': (100, float('inf'))
-        }
-        
-        if price_range not in ranges:
+        if price_range == 'all' or not recommendations or price_range not in PRICE_RANGES:
             return recommendations
         
-        min_price, max_price = ranges[price_range]
+        min_price, max_price = PRICE_RANGES[price_range]
         return [r for r in recommendations if r.get('price') and min_price <= r['price'] < max_price]
     
     def get_daily_sentiment(self, force_refresh: bool = False, currency: str = 'USD') -> Dict:
@@ -1064,38 +1103,30 @@ class MarketSentimentService:
     
     def _convert_sentiment_currency(self, data: Dict, target_currency: str) -> Dict:
         """Convert all prices in sentiment data to target currency"""
-        if not data or target_currency == 'USD':
-            # Already in USD or no data
-            result = data.copy()
-            result['currency'] = target_currency
-            return result
-        
-        result = data.copy()
+        # Look the rate up once rather than per recommendation
+        rate = self._convert_price(1.0, target_currency)
         
-        # Convert buy recommendations
-        if 'buy_recommendations' in result:
-            result['buy_recommendations'] = [
-                {
-                    **rec,
-                    'price': round(self._convert_price(rec['price'], target_currency), 2)
-                    if rec.get('price') else None
-                }
-                for rec in result['buy_recommendations']
-            ]
+        result = {**(data or {}), 'currency': target_currency}
+        if not data or rate == 1.0:
+            # USD/NATIVE (or no data): prices are already in the target currency
+            return result
         
-        # Convert sell recommendations
-        if 'sell_recommendations' in result:
-            result['sell_recommendations'] = [
-                {
-                    **rec,
-                    'price': round(self._convert_price(rec['price'], target_currency), 2)
-                    if rec.get('price') else None
-                }
-                for rec in result['sell_recommendations']
-            ]
+        # Convert buy and sell recommendations
+        for key in ('buy_recommendations', 'sell_recommendations'):
+            if key in result:
+                result[key] = [self._convert_rec_price(rec, rate) for rec in result[key]]
         
-        result['currency'] = target_currency
         return result
+    
+    @staticmethod
+    def _convert_rec_price(rec: Dict, rate: float) -> Dict:
+        """Recommendation with its price converted at rate; recs already priced None are reused"""
+        if rec.get('price'):
+            return {**rec, 'price': round(rec['price'] * rate, 2)}
+        if 'price' in rec and rec['price'] is None:
+            return rec
+        # Missing or zero price
+        return {**rec, 'price': None}
 
 
 # Singleton instance
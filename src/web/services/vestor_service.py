@@ -7,13 +7,215 @@ from src.web.services.analysis_service import AnalysisService
 import re
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
+# Company to ticker mapping
+COMPANY_TO_TICKER = {
+    # Tech Giants
+    'apple': 'AAPL', 'microsoft': 'MSFT', 'tesla': 'TSLA', 'amazon': 'AMZN',
+    'google': 'GOOGL', 'alphabet': 'GOOGL', 'meta': 'META', 'facebook': 'META',
+    'nvidia': 'NVDA', 'netflix': 'NFLX', 'amd': 'AMD', 'intel': 'INTC',
+    
+    # Aerospace & Defense
+    'boeing': 'BA', 'lockheed': 'LMT', 'lockheed martin': 'LMT',
+    'northrop': 'NOC', 'northrop grumman': 'NOC', 'raytheon': 'RTX',
+    
+    # Finance
+    'jpmorgan': 'JPM', 'jp morgan': 'JPM', 'bank of america': 'BAC',
+    'wells fargo': 'WFC', 'goldman': 'GS', 'goldman sachs': 'GS',
+    'morgan stanley': 'MS', 'citigroup': 'C', 'visa': 'V', 'mastercard': 'MA',
+    
+    # Retail & Consumer
+    'walmart': 'WMT', 'target': 'TGT', 'costco': 'COST', 'home depot': 'HD',
+    'mcdonalds': 'MCD', "mcdonald's": 'MCD', 'starbucks': 'SBUX',
+    'coca cola': 'KO', 'coca-cola': 'KO', 'pepsi': 'PEP', 'pepsico': 'PEP',
+    'nike': 'NKE', 'procter': 'PG', 'procter & gamble': 'PG',
+    
+    # Healthcare & Pharma
+    'johnson': 'JNJ', 'johnson & johnson': 'JNJ', 'pfizer': 'PFE',
+    'moderna': 'MRNA', 'merck': 'MRK', 'abbvie': 'ABBV',
+    'unitedhealth': 'UNH', 'united health': 'UNH',
+    
+    # Energy
+    'exxon': 'XOM', 'exxonmobil': 'XOM', 'chevron': 'CVX',
+    'conocophillips': 'COP', 'shell': 'SHEL',
+    
+    # Entertainment & Media
+    'disney': 'DIS', 'warner': 'WBD', 'comcast': 'CMCSA',
+    'paramount': 'PARA', 'sony': 'SONY',
+    
+    # Automotive
+    'ford': 'F', 'gm': 'GM', 'general motors': 'GM',
+    
+    # Cryptocurrency
+    'bitcoin': 'BTC-USD', 'ethereum': 'ETH-USD',
+    'ripple': 'XRP-USD', 'xrp': 'XRP-USD', 'cardano': 'ADA-USD', 
+    'dogecoin': 'DOGE-USD', 'solana': 'SOL-USD', 'bnb': 'BNB-USD',
+    'binance coin': 'BNB-USD', 'polkadot': 'DOT-USD'
+}
+
+# Questions asking for a company's ticker symbol
+TICKER_LOOKUP_PATTERNS = tuple(re.compile(p) for p in (
+    r"what(?:'s| is) the ticker (?:for|of|symbol for)\s+(.+?)(?:\?|$)",
+    r"what ticker (?:is|for)\s+(.+?)(?:\?|$)",
+    r"ticker (?:for|of|symbol for)\s+(.+?)(?:\?|$)",
+    r"(?:what|give me|tell me) (?:the )?ticker\s+(?:for|of)\s+(.+?)(?:\?|$)",
+    r"(?:do you know|what's) (?:the )?(?:stock )?symbol (?:for|of)\s+(.+?)(?:\?|$)",
+))
+COMPANY_SUFFIX_RE = re.compile(r'\b(stock|company|corp|corporation|inc|limited|ltd)\b')
+TICKER_RE = re.compile(r'\b([A-Z]{2,5}(?:[-][A-Z]{2,4})?)\b')
+LOOSE_TICKER_RE = re.compile(r'\b([A-Z]{2,5})\b')
+
+
+def _trie_pattern(words):
+    """
+    Regex matching any of the words, with shared prefixes factored out ("b(?:oeing|itcoin)")
+    Each position then tries one branch per distinct next character instead of every word,
+    and greedy optional tails make the longest word win
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # end of word
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            pattern = ('(?:' + pattern + ')' if len(branches) == 1 else pattern) + '?'
+        return pattern
+    
+    return build(trie)
+
+
+# Every company name in one prefix-factored pattern, so a single scan finds
+# "lockheed martin" rather than "lockheed" (substring semantics as before).
+# Zero-width lookahead, so overlapping names ("jp morgan stanley") are all reported
+COMPANY_NAME_RE = re.compile('(?=(' + _trie_pattern(COMPANY_TO_TICKER) + '))')
+
+# Position in COMPANY_TO_TICKER; detected names keep this priority, not the order they appear
+COMPANY_PRIORITY = {name: i for i, name in enumerate(COMPANY_TO_TICKER)}
+
+# Longest company name in words, bounding the prefix lookups below
+MAX_COMPANY_WORDS = max(len(name.split()) for name in COMPANY_TO_TICKER)
+
+
+@lru_cache(maxsize=2048)
+def lookup_company_ticker(company_phrase):
+    """
+    Resolve the company phrase captured from a ticker lookup question
+    Falls back to the longest known company name the phrase starts with ("boeing shares"),
+    which costs at most MAX_COMPANY_WORDS dict lookups however large the mapping grows
+    Returns (cleaned company name, ticker or None); repeated phrases are served from the cache
+    """
+    company_name = COMPANY_SUFFIX_RE.sub('', company_phrase.strip()).strip()
+    ticker = COMPANY_TO_TICKER.get(company_name.lower())
+    if ticker:
+        return company_name, ticker
+    
+    words = company_name.split()
+    for n in range(min(len(words) - 1, MAX_COMPANY_WORDS), 0, -1):
+        prefix = ' '.join(words[:n])
+        ticker = COMPANY_TO_TICKER.get(prefix.lower())
+        if ticker:
+            return prefix, ticker
+    return company_name, None
+
+
+# Answer when the chat assistant fails; _fallback_response hands out shallow copies
+FALLBACK_RESPONSE = {
+    'answer': """Hi! I'm Vestor, your AI financial advisor. I'm here to help you with:
+
+📊 **Stock & Crypto Analysis** - Just mention any ticker or company name
+📚 **Investment Education** - Ask me anything about investing
+💼 **Portfolio Advice** - Let's discuss your investment strategy
+
+What would you like to know about?""",
+    'vestor_mode': 'conversation',
+    'is_conversational': True,
+    'success': True
+}
+
+
+# Messages opening with one of these get Vestor's introduction
+GREETINGS = frozenset({
+    'hi', 'hello', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings'
+})
+GREETING_FIRST_WORDS = frozenset(greeting.split()[0] for greeting in GREETINGS)
+
+
+def is_greeting(question_lower):
+    """Whether the question opens with a greeting; only its first one or two words are looked at"""
+    words = question_lower.split(maxsplit=2)
+    if not words or words[0] not in GREETING_FIRST_WORDS:
+        return False
+    return words[0] in GREETINGS or ' '.join(words[:2]) in GREETINGS
+
+
+# Educational questions answered without the context ticker
+GENERAL_QUESTION_KEYWORDS = (
+    'what is', 'what are', 'how do i', 'how to', 'explain', 'tell me about investing',
+    'should i invest', 'how does', 'can you explain', 'what does',
+    'dividend', 'p/e ratio', 'pe ratio', 'rsi', 'macd', 'diversif',
+    'getting started', 'start investing', 'begin invest', 'volatil', 'crypto',
+    'sector', 'portfolio', 'strategy', 'risk management'
+)
+
+# Phrases marking a follow-up about the context ticker
+FOLLOW_UP_PHRASES = (
+    'is it', 'worth it', 'what about it', 'tell me more',
+    'more info', 'thoughts on that', 'opinion on it', 'the stock', 'that stock',
+    'analyze it', 'buy it', 'sell it', 'how about that', 'good investment'
+)
+
+
+def classify_question(question_lower):
+    """
+    Classify a lowercased question for ticker resolution
+    Returns (is_general, is_follow_up); a follow-up also has to be short (< 100 chars)
+    """
+    is_general = any(keyword in question_lower for keyword in GENERAL_QUESTION_KEYWORDS)
+    is_follow_up = (
+        len(question_lower) < 100
+        and any(phrase in question_lower for phrase in FOLLOW_UP_PHRASES)
+    )
+    return is_general, is_follow_up
+
+
+# Common words to exclude from ticker detection
+EXCLUDED_WORDS = frozenset({
+    'HELLO', 'HI', 'HEY', 'THANKS', 'THANK', 'YOU', 'YES', 'NO', 'OK', 'OKAY',
+    'BYE', 'GOODBYE', 'PLEASE', 'SORRY', 'THE', 'AND', 'FOR', 'BUT', 'NOT',
+    'WITH', 'FROM', 'ABOUT', 'WHAT', 'WHERE', 'WHEN', 'WHY', 'HOW', 'WHO',
+    'WHICH', 'THIS', 'THAT', 'THESE', 'THOSE', 'CAN', 'COULD', 'WOULD',
+    'SHOULD', 'WILL', 'SHALL', 'MAY', 'MIGHT', 'MUST', 'JUST', 'VERY',
+    'ALSO', 'EVEN', 'STILL', 'ONLY', 'LIKE', 'NEED', 'WANT', 'MAKE',
+    'KNOW', 'THINK', 'TAKE', 'COME', 'GIVE', 'LOOK', 'USE', 'FIND'
+})
+
+# Commodity/general investment terms that shouldn't be treated as tickers
+# unless explicitly meant as tickers (e.g., "analyze CORN" vs "invest in corn")
+COMMODITY_TERMS = frozenset({'CORN', 'WHEAT', 'RICE', 'GOLD', 'SILVER', 'OIL', 'GAS', 'WATER'})
+COMMODITY_TICKER_RE = {
+    t: re.compile(rf'\b(analyze|check|look at|show me|ticker|symbol)\s+{t}\b', re.IGNORECASE)
+    for t in COMMODITY_TERMS
+}
+
+
 class VestorService:
     """Service for managing Vestor AI conversations"""
     
+    # Max tickers whose analysis context is kept for follow-up questions (LRU)
+    ANALYSIS_CONTEXT_CACHE_SIZE = 32
+    
     def __init__(self):
         self.chat_assistant = None
         self.analysis_service = AnalysisService()
@@ -23,50 +225,10 @@ class VestorService:
         self.chat_logs_dir = Path('logs/chat_interactions')
         self.chat_logs_dir.mkdir(parents=True, exist_ok=True)
         
-        # Company to ticker mapping
-        self.company_to_ticker = {
-            # Tech Giants
-            'apple': 'AAPL', 'microsoft': 'MSFT', 'tesla': 'TSLA', 'amazon': 'AMZN',
-            'google': 'GOOGL', 'alphabet': 'GOOGL', 'meta': 'META', 'facebook': 'META',
-            'nvidia': 'NVDA', 'netflix': 'NFLX', 'amd': 'AMD', 'intel': 'INTC',
-            
-            # Aerospace & Defense
-            'boeing': 'BA', 'lockheed': 'LMT', 'lockheed martin': 'LMT',
-            'northrop': 'NOC', 'northrop grumman': 'NOC', 'raytheon': 'RTX',
-            
-            # Finance
-            'jpmorgan': 'JPM', 'jp morgan': 'JPM', 'bank of america': 'BAC',
-            'wells fargo': 'WFC', 'goldman': 'GS', 'goldman sachs': 'GS',
-            'morgan stanley': 'MS', 'citigroup': 'C', 'visa': 'V', 'mastercard': 'MA',
-            
-            # Retail & Consumer
-            'walmart': 'WMT', 'target': 'TGT', 'costco': 'COST', 'home depot': 'HD',
-            'mcdonalds': 'MCD', "mcdonald's": 'MCD', 'starbucks': 'SBUX',
-            'coca cola': 'KO', 'coca-cola': 'KO', 'pepsi': 'PEP', 'pepsico': 'PEP',
-            'nike': 'NKE', 'procter': 'PG', 'procter & gamble': 'PG',
-            
-            # Healthcare & Pharma
-            'johnson': 'JNJ', 'johnson & johnson': 'JNJ', 'pfizer': 'PFE',
-            'moderna': 'MRNA', 'merck': 'MRK', 'abbvie': 'ABBV',
-            'unitedhealth': 'UNH', 'united health': 'UNH',
-            
-            # Energy
-            'exxon': 'XOM', 'exxonmobil': 'XOM', 'chevron': 'CVX',
-            'conocophillips': 'COP', 'shell': 'SHEL',
-            
-            # Entertainment & Media
-            'disney': 'DIS', 'warner': 'WBD', 'comcast': 'CMCSA',
-            'paramount': 'PARA', 'sony': 'SONY',
-            
-            # Automotive
-            'ford': 'F', 'gm': 'GM', 'general motors': 'GM',
-            
-            # Cryptocurrency
-            'bitcoin': 'BTC-USD', 'ethereum': 'ETH-USD',
-            'ripple': 'XRP-USD', 'xrp': 'XRP-USD', 'cardano': 'ADA-USD', 
-            'dogecoin': 'DOGE-USD', 'solana': 'SOL-USD', 'bnb': 'BNB-USD',
-            'binance coin': 'BNB-USD', 'polkadot': 'DOT-USD'
-        }
+        self.company_to_ticker = COMPANY_TO_TICKER
+        
+        # ticker -> (analysis result, context string) for follow-up questions
+        self._analysis_contexts = OrderedDict()
     
     def _log_conversation(self, question, answer, ticker, vestor_mode, metadata=None):
         """
@@ -111,25 +273,11 @@ class VestorService:
         Handle questions asking for ticker symbols
         Returns response dict if it's a ticker lookup question, None otherwise
         """
-        # Patterns that indicate ticker lookup questions
-        ticker_lookup_patterns = [
-            r"what(?:'s| is) the ticker (?:for|of|symbol for)\s+(.+?)(?:\?|$)",
-            r"what ticker (?:is|for)\s+(.+?)(?:\?|$)",
-            r"ticker (?:for|of|symbol for)\s+(.+?)(?:\?|$)",
-            r"(?:what|give me|tell me) (?:the )?ticker\s+(?:for|of)\s+(.+?)(?:\?|$)",
-            r"(?:do you know|what's) (?:the )?(?:stock )?symbol (?:for|of)\s+(.+?)(?:\?|$)",
-        ]
-        
-        for pattern in ticker_lookup_patterns:
-            match = re.search(pattern, question_lower)
+        for pattern in TICKER_LOOKUP_PATTERNS:
+            match = pattern.search(question_lower)
             if match:
-                company_name = match.group(1).strip()
-                
-                # Clean up common words
-                company_name = re.sub(r'\b(stock|company|corp|corporation|inc|limited|ltd)\b', '', company_name).strip()
-                
-                # Look up in our mapping
-                ticker = self.company_to_ticker.get(company_name.lower())
+                # Strip common words and look up in our mapping
+                company_name, ticker = lookup_company_ticker(match.group(1))
                 
                 if ticker:
                     # Success - found the ticker
@@ -155,7 +303,7 @@ Just say "analyze {ticker}" or "what do you think about {ticker}?" and I'll dive
                     print(f"❓ Unknown company: '{company_name}'")
                     
                     # Try to extract potential ticker if it looks like one (2-5 capital letters)
-                    potential_ticker_match = re.search(r'\b([A-Z]{2,5})\b', question)
+                    potential_ticker_match = LOOSE_TICKER_RE.search(question)
                     if potential_ticker_match:
                         potential_ticker = potential_ticker_match.group(1)
                         return {
@@ -278,7 +426,8 @@ Just say the company name and I'll look it up for you! 📊""",
         print(f"📝 User: {question}")
         
         assistant = self._get_chat_assistant()
-        question_lower = question.lower()
+        # Lowercased once here and handed to every detector below
+        question_lower = question.lower().strip()
         
         # Build conversation context
         conversation_context = self._build_conversation_context(conversation_history)
@@ -329,7 +478,7 @@ Just say the company name and I'll look it up for you! 📊""",
             print(f"🤖 Vestor Mode: General Conversation")
             print("="*80 + "\n")
             # Pure conversational response
-            response = self._handle_conversation(question, vestor_prompt, mentioned_tickers)
+            response = self._handle_conversation(question, question_lower, vestor_prompt, mentioned_tickers)
         
         # Log the conversation
         self._log_conversation(
@@ -362,36 +511,21 @@ Just say the company name and I'll look it up for you! 📊""",
         """Detect ticker symbols and company names in question"""
         mentioned = []
         
-        # Common words to exclude from ticker detection
-        excluded_words = {
-            'HELLO', 'HI', 'HEY', 'THANKS', 'THANK', 'YOU', 'YES', 'NO', 'OK', 'OKAY',
-            'BYE', 'GOODBYE', 'PLEASE', 'SORRY', 'THE', 'AND', 'FOR', 'BUT', 'NOT',
-            'WITH', 'FROM', 'ABOUT', 'WHAT', 'WHERE', 'WHEN', 'WHY', 'HOW', 'WHO',
-            'WHICH', 'THIS', 'THAT', 'THESE', 'THOSE', 'CAN', 'COULD', 'WOULD',
-            'SHOULD', 'WILL', 'SHALL', 'MAY', 'MIGHT', 'MUST', 'JUST', 'VERY',
-            'ALSO', 'EVEN', 'STILL', 'ONLY', 'LIKE', 'NEED', 'WANT', 'MAKE',
-            'KNOW', 'THINK', 'TAKE', 'COME', 'GIVE', 'LOOK', 'USE', 'FIND'
-        }
-        
-        # Commodity/general investment terms that shouldn't be treated as tickers
-        # unless explicitly meant as tickers (e.g., "analyze CORN" vs "invest in corn")
-        commodity_terms = {'CORN', 'WHEAT', 'RICE', 'GOLD', 'SILVER', 'OIL', 'GAS', 'WATER'}
-        
         # Check for company names first (these take priority)
-        for company, ticker in self.company_to_ticker.items():
-            if company in question_lower:
+        companies = {match.group(1) for match in COMPANY_NAME_RE.finditer(question_lower)}
+        for company in sorted(companies, key=COMPANY_PRIORITY.__getitem__):
+            ticker = self.company_to_ticker[company]
+            if ticker not in mentioned:
                 mentioned.append(ticker)
                 print(f"🏢 Detected '{company}' → {ticker}")
         
         # Check for explicit ticker symbols
-        ticker_pattern = r'\b([A-Z]{2,5}(?:[-][A-Z]{2,4})?)\b'
-        potential_tickers = re.findall(ticker_pattern, question)
-        for t in potential_tickers:
-            if t not in mentioned and t not in excluded_words:
+        for t in TICKER_RE.findall(question):
+            if t not in mentioned and t not in EXCLUDED_WORDS:
                 # If it's a commodity term, only include if used as ticker (e.g., "analyze CORN", not "corn investment")
-                if t in commodity_terms:
+                if t in COMMODITY_TERMS:
                     # Check if it's used in a ticker-like context
-                    if re.search(rf'\b(analyze|check|look at|show me|ticker|symbol)\s+{t}\b', question, re.IGNORECASE):
+                    if COMMODITY_TICKER_RE[t].search(question):
                         mentioned.append(t)
                         print(f"📊 Detected ticker: {t} (explicit usage)")
                     else:
@@ -412,30 +546,18 @@ Just say the company name and I'll look it up for you! 📊""",
         if mentioned:
             return mentioned[0]
         
-        # Priority 3: Check if this is a GENERAL educational question (should NOT use context)
-        general_question_keywords = [
-            'what is', 'what are', 'how do i', 'how to', 'explain', 'tell me about investing',
-            'should i invest', 'how does', 'can you explain', 'what does',
-            'dividend', 'p/e ratio', 'pe ratio', 'rsi', 'macd', 'diversif',
-            'getting started', 'start investing', 'begin invest', 'volatil', 'crypto',
-            'sector', 'portfolio', 'strategy', 'risk management'
-        ]
-        if any(keyword in question_lower for keyword in general_question_keywords):
+        is_general, is_follow_up = classify_question(question_lower)
+        
+        # Priority 3: GENERAL educational questions should NOT use context
+        if is_general:
             print(f"📚 General educational question - clearing context ticker")
             return None
         
-        # Priority 4: Check for follow-up indicators about previous ticker
+        # Priority 4: Follow-up about previous ticker
         # Only use context ticker if NO new ticker was mentioned AND not a general question
-        if context_ticker and not mentioned:
-            follow_up_phrases = [
-                'is it', 'worth it', 'what about it', 'tell me more',
-                'more info', 'thoughts on that', 'opinion on it', 'the stock', 'that stock',
-                'analyze it', 'buy it', 'sell it', 'how about that', 'good investment'
-            ]
-            # More specific follow-up: requires at least one phrase AND short question
-            if any(phrase in question_lower for phrase in follow_up_phrases) and len(question_lower) < 100:
-                print(f"🔄 Follow-up about: {context_ticker}")
-                return context_ticker
+        if context_ticker and is_follow_up:
+            print(f"🔄 Follow-up about: {context_ticker}")
+            return context_ticker
         
         return None
     
@@ -519,13 +641,10 @@ What would you like to know about {ticker}?""",
                 'success': True
             }
     
-    def _handle_conversation(self, question, prompt, mentioned_tickers):
+    def _handle_conversation(self, question, question_lower, prompt, mentioned_tickers):
         """Handle pure conversational response (no stock analysis)"""
-        question_lower = question.lower().strip()
-        
         # Handle greetings with friendly responses
-        greetings = ['hi', 'hello', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings']
-        if any(question_lower == greeting or question_lower.startswith(greeting + ' ') for greeting in greetings):
+        if is_greeting(question_lower):
             return {
                 'answer': """👋 Hello! I'm **Vestor**, your AI financial advisor and investment mentor.
 
@@ -632,13 +751,17 @@ Let me analyze it first so I can give you informed insights. Would you like me t
             'success': True
         }
     
-    def _handle_stock_conversation(self, question, ticker, cached_analysis, prompt):
-        """Handle conversation with stock analysis context"""
-        try:
-            cached_result = cached_analysis['result']
-            
-            # Build analysis context
-            analysis_context = f"""
+    def _get_analysis_context(self, ticker, cached_result):
+        """
+        Build the analysis context block for a ticker, reusing it while the analysis is unchanged
+        A fresh analysis replaces the cached result object, which invalidates the stored context
+        """
+        cached = self._analysis_contexts.get(ticker)
+        if cached is not None and cached[0] is cached_result:
+            self._analysis_contexts.move_to_end(ticker)
+            return cached[1]
+        
+        analysis_context = f"""
 === Real-Time Analysis Data for {ticker} ===
 Current Price: ${cached_result.get('current_price', 0):.2f}
 Price Change: {cached_result.get('price_change', 0):+.2f}%
@@ -658,6 +781,16 @@ Key Reasons:
 - Provide your investment perspective
 - Don't just repeat the data - add insights and context
 """
+        self._analysis_contexts[ticker] = (cached_result, analysis_context)
+        self._analysis_contexts.move_to_end(ticker)
+        if len(self._analysis_contexts) > self.ANALYSIS_CONTEXT_CACHE_SIZE:
+            self._analysis_contexts.popitem(last=False)
+        return analysis_context
+    
+    def _handle_stock_conversation(self, question, ticker, cached_analysis, prompt):
+        """Handle conversation with stock analysis context"""
+        try:
+            analysis_context = self._get_analysis_context(ticker, cached_analysis['result'])
             
             full_context = prompt + "\n\n" + analysis_context
             
@@ -686,18 +819,7 @@ Key Reasons:
     
     def _fallback_response(self):
         """Fallback response when AI fails"""
-        return {
-            'answer': """Hi! I'm Vestor, your AI financial advisor. I'm here to help you with:
-
-📊 **Stock & Crypto Analysis** - Just mention any ticker or company name
-📚 **Investment Education** - Ask me anything about investing
-💼 **Portfolio Advice** - Let's discuss your investment strategy
-
-What would you like to know about?""",
-            'vestor_mode': 'conversation',
-            'is_conversational': True,
-            'success': True
-        }
+        return dict(FALLBACK_RESPONSE)
     
     def _fallback_with_data(self, ticker, cached_analysis):
         """Fallback with available analysis data"""
@@ -0,0 +1,15 @@
+"""
+Shared Flask test app
+create_app() wires blueprints and analyzer singletons, so build it once per process
+"""
+import functools
+
+from src.web import create_app
+
+
+@functools.lru_cache(maxsize=1)
+def get_test_app():
+    """Return the process-wide Flask app configured for testing"""
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
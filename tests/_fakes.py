@@ -0,0 +1,68 @@
+"""
+Lightweight fakes for PortfolioAnalyzer and StockChatAssistant collaborators
+Plain objects that expose only what the analysis path touches and record their calls
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class FakeDataFetcher:
+    """Stands in for DataFetcher; returns canned data"""
+    df: Any = None
+    stock_info: Dict = field(default_factory=lambda: {
+        'name': 'Test Company',
+        'sector': 'Technology',
+        'industry': 'Software'
+    })
+    news: List[Dict] = field(default_factory=list)
+    pre_market_data: Optional[Dict] = None
+    calls: List[tuple] = field(default_factory=list)
+
+    def fetch_historical_data(self, *args, **kwargs):
+        self.calls.append(('fetch_historical_data', args, kwargs))
+        return self.df
+
+    def get_stock_info(self, *args, **kwargs):
+        self.calls.append(('get_stock_info', args, kwargs))
+        return self.stock_info
+
+    def get_pre_market_data(self, *args, **kwargs):
+        self.calls.append(('get_pre_market_data', args, kwargs))
+        return self.pre_market_data
+
+    def fetch_news(self, *args, **kwargs):
+        self.calls.append(('fetch_news', args, kwargs))
+        return list(self.news)
+
+
+@dataclass
+class FakeSocialMediaFetcher:
+    """Stands in for SocialMediaFetcher; returns canned posts"""
+    posts: List[Dict] = field(default_factory=list)
+    calls: List[tuple] = field(default_factory=list)
+
+    def fetch_all_social_media(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return list(self.posts)
+
+
+@dataclass
+class FakeSentimentAnalyzer:
+    """Stands in for the news/social sentiment models; always neutral"""
+    def analyze(self, text):
+        return {'label': 'neutral', 'score': 0.5, 'positive': 0.0, 'neutral': 1.0, 'negative': 0.0}
+
+    def analyze_batch(self, texts):
+        return [self.analyze(text) for text in texts]
+
+
+@dataclass
+class FakeQAPipeline:
+    """Stands in for the transformers question-answering pipeline; no model download"""
+    answer: str = 'Investment means allocating capital to assets expecting a future return.'
+    calls: List[tuple] = field(default_factory=list)
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return {'answer': self.answer, 'score': 0.9, 'start': 0, 'end': len(self.answer)}
@@ -4,15 +4,78 @@ Tests the bot's ability to handle natural, unpredictable user questions
 and adapt intelligently to various conversation flows.
 """
 
+import functools
 import pytest
+import re
 import requests
 import time
 import json
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Set, Tuple
 
 BASE_URL = "http://localhost:5000"
 CHAT_ENDPOINT = f"{BASE_URL}/chat"
 
+# Phrase groups checked by _validate_behavior, keyed by group name
+PHRASE_GROUPS = {
+    # Prompting instead of answering
+    'unhelpful': (
+        'how can i help',
+        'what would you like to know',
+        'ask me anything',
+        'i can help you with'
+    ),
+    'robotic': (
+        'as an ai',
+        'i am programmed to',
+        'my algorithms',
+        'i do not have the ability'
+    ),
+    # "Ask me questions about X" style loops
+    'loop': (
+        'would you like me to analyze',
+        'just ask',
+        'what would you like to know',
+        'ask me about',
+        'i can help you with',
+        'how can i assist'
+    ),
+    'generic': (
+        'i\'m here to help you',
+        'i can help you with',
+        'how can i help',
+        'what would you like to know',
+        'being analyzed',
+        'being assessed'
+    ),
+}
+
+# Phrase -> groups it belongs to; one phrase can count towards several groups
+_PHRASE_TO_GROUPS = {}
+for _group, _phrases in PHRASE_GROUPS.items():
+    for _phrase in _phrases:
+        _PHRASE_TO_GROUPS.setdefault(_phrase, set()).add(_group)
+
+# Zero-width lookahead so overlapping phrases are all reported in a single scan
+_PHRASE_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(p) for p in sorted(_PHRASE_TO_GROUPS, key=len, reverse=True)) + '))'
+)
+
+
+def matched_phrase_groups(text_lower: str) -> Set[str]:
+    """Return the PHRASE_GROUPS names with at least one phrase in the (lowercased) text"""
+    return {group for m in _PHRASE_RE.finditer(text_lower) for group in _PHRASE_TO_GROUPS[m.group(1)]}
+
+
+@functools.lru_cache(maxsize=32)
+def _answer_features(answer: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Lowercased answer and its matched phrase groups, computed once per answer
+    and shared by every behavior validated against it
+    """
+    answer_lower = answer.lower()
+    return answer_lower, frozenset(matched_phrase_groups(answer_lower))
+
+
 class ConversationTester:
     """Simulates real user conversations with the chatbot"""
     
@@ -89,21 +152,15 @@ class ConversationTester:
     
     def _validate_behavior(self, question: str, answer: str, behavior: str) -> bool:
         """Validate if the answer exhibits the expected behavior"""
-        answer_lower = answer.lower()
+        answer_lower, phrase_groups = _answer_features(answer)
         question_lower = question.lower()
         
         if behavior == 'helpful':
             # Should provide actual information, not just say "I can help"
-            unhelpful_phrases = [
-                'how can i help',
-                'what would you like to know',
-                'ask me anything',
-                'i can help you with'
-            ]
             # Answer should be longer than 200 chars and not just prompting
             is_helpful = (
                 len(answer) > 200 and
-                not any(phrase in answer_lower for phrase in unhelpful_phrases) and
+                'unhelpful' not in phrase_groups and
                 ('##' in answer or '**' in answer or '\n\n' in answer)  # Has structure
             )
             if not is_helpful:
@@ -114,13 +171,7 @@ class ConversationTester:
         
         elif behavior == 'natural':
             # Should sound conversational, not robotic
-            robotic_phrases = [
-                'as an ai',
-                'i am programmed to',
-                'my algorithms',
-                'i do not have the ability'
-            ]
-            is_natural = not any(phrase in answer_lower for phrase in robotic_phrases)
+            is_natural = 'robotic' not in phrase_groups
             if not is_natural:
                 print(f"❌ FAIL [natural]: Response sounds robotic")
             else:
@@ -171,15 +222,7 @@ class ConversationTester:
         
         elif behavior == 'no_loop':
             # Should NOT create loops like "ask me questions about X"
-            loop_phrases = [
-                'would you like me to analyze',
-                'just ask',
-                'what would you like to know',
-                'ask me about',
-                'i can help you with',
-                'how can i assist'
-            ]
-            has_loop = any(phrase in answer_lower for phrase in loop_phrases)
+            has_loop = 'loop' in phrase_groups
             if has_loop:
                 print(f"❌ FAIL [no_loop]: Response creates a conversation loop")
             else:
@@ -188,15 +231,7 @@ class ConversationTester:
         
         elif behavior == 'no_generic':
             # Should NOT give generic "I'm here to help" responses
-            generic_phrases = [
-                'i\'m here to help you',
-                'i can help you with',
-                'how can i help',
-                'what would you like to know',
-                'being analyzed',
-                'being assessed'
-            ]
-            is_generic = any(phrase in answer_lower for phrase in generic_phrases)
+            is_generic = 'generic' in phrase_groups
             if is_generic:
                 print(f"❌ FAIL [no_generic]: Response is too generic")
             else:
@@ -7,12 +7,15 @@ import sys
 import os
 import unittest
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.web.services.dynamic_recommendations import DynamicRecommendationService
 
 
+@pytest.mark.network
 class TestConsolidatedScoring(unittest.TestCase):
     """Test consolidated technical + fundamental scoring."""
 
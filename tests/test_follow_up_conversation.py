@@ -8,9 +8,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.web.services.vestor_service import VestorService
 
-def test_follow_up_flow():
+def test_follow_up_flow(vestor):
     """Test that follow-up questions use the context ticker"""
-    vestor = VestorService()
     
     print("\n" + "="*80)
     print("TEST: Follow-up Question Flow")
@@ -66,9 +65,8 @@ def test_follow_up_flow():
         print(f"✅ Mode: {result2['vestor_mode']}")
         return True
 
-def test_ticker_resolution():
+def test_ticker_resolution(vestor):
     """Test ticker resolution logic"""
-    vestor = VestorService()
     
     print("\n" + "="*80)
     print("TEST: Ticker Resolution")
@@ -100,10 +98,11 @@ if __name__ == "__main__":
     success = True
     
     try:
-        if not test_ticker_resolution():
+        vestor = VestorService()
+        if not test_ticker_resolution(vestor):
             success = False
         
-        if not test_follow_up_flow():
+        if not test_follow_up_flow(vestor):
             success = False
             
     except Exception as e:
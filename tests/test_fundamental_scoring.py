@@ -8,6 +8,8 @@ import sys
 import os
 import unittest
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -21,6 +23,7 @@ class TestFundamentalScoring(unittest.TestCase):
         """Initialize service."""
         self.service = DynamicRecommendationService()
 
+    @pytest.mark.network
     def test_calculate_fundamental_score_healthy_company(self):
         """
         AAPL: Strong fundamentals (despite high D/E from buybacks)
@@ -66,6 +69,7 @@ class TestFundamentalScoring(unittest.TestCase):
         self.assertGreaterEqual(score, 0.0, "Score should be >= 0")
         self.assertLessEqual(score, 1.0, "Score should be <= 1")
 
+    @pytest.mark.network
     def test_fundamental_score_components(self):
         """
         Verify scoring components make sense:
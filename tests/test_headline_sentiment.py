@@ -6,6 +6,7 @@ Uses HuggingFace DistilBERT for local sentiment inference.
 import sys
 import os
 import unittest
+from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -201,5 +202,31 @@ class TestHeadlineSentiment(unittest.TestCase):
                               msg="Same headline should give consistent scores")
 
 
+class TestHeadlineSentimentBatchCache(unittest.TestCase):
+    """Test that repeated headline lists are only scored once."""
+
+    def setUp(self):
+        """Service with a stub pipeline, so no model is downloaded."""
+        self.pipeline = MagicMock(return_value=[{'label': 'POSITIVE', 'score': 0.9}])
+        with patch('src.web.services.headline_sentiment_service.pipeline', return_value=self.pipeline):
+            self.service = HeadlineSentimentService()
+
+    def test_same_headlines_scored_once(self):
+        headlines = ["Strong earnings", "Revenue beats estimates"]
+
+        first = self.service.analyze_headlines_batch(headlines)
+        second = self.service.analyze_headlines_batch(list(headlines))
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.pipeline.call_count, len(headlines))
+
+    def test_cached_result_not_shared(self):
+        """Callers get their own copy of a cached analysis."""
+        self.service.analyze_headlines_batch(["Strong earnings"])['results'].clear()
+
+        self.assertEqual(self.service.analyze_headlines_batch(["Strong earnings"])['count'], 1)
+        self.assertEqual(len(self.service.analyze_headlines_batch(["Strong earnings"])['results']), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
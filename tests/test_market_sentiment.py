@@ -4,26 +4,38 @@ Tests the market sentiment service and API endpoint
 """
 import unittest
 from unittest.mock import patch, MagicMock
-from src.web import create_app
+from tests._app import get_test_app
 from src.web.services.market_sentiment_service import MarketSentimentService, get_market_sentiment_service
 import json
 import os
+import tempfile
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 
 
+# Fake price history returned by the mocked yfinance Ticker
+_FAKE_HIST = pd.DataFrame(
+    {
+        'Open': np.linspace(99.0, 99.8, 5),
+        'Close': np.linspace(99.0, 100.0, 5),
+        'Volume': np.full(5, 1_000_000),
+    },
+    index=pd.date_range('2024-01-01', periods=5),
+)
+
+
 class TestMarketSentimentService(unittest.TestCase):
     """Test the market sentiment service"""
     
     def setUp(self):
         """Set up test environment"""
         self.service = MarketSentimentService()
-        # Use a test cache file
-        self.service.cache_file = 'cache/test_market_sentiment_cache.json'
-        
-    def tearDown(self):
-        """Clean up test cache file"""
-        if os.path.exists(self.service.cache_file):
-            os.remove(self.service.cache_file)
+        # Use a per-test cache file so parallel workers never share one path
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.service.cache_file = os.path.join(tmp_dir.name, os.path.basename(self.service.cache_file))
+        self.service.legacy_cache_file = os.path.join(tmp_dir.name, 'market_sentiment_cache.json')
     
     def test_service_initialization(self):
         """Test: Service initializes correctly"""
@@ -48,17 +60,7 @@ class TestMarketSentimentService(unittest.TestCase):
     @patch('yfinance.Ticker')
     def test_get_market_indices_data(self, mock_ticker):
         """Test: Market indices data fetching"""
-        # Mock yfinance response
-        mock_hist = MagicMock()
-        mock_hist.empty = False
-        mock_hist.__len__ = lambda x: 5
-        mock_hist.__getitem__ = lambda x, key: MagicMock(
-            iloc=MagicMock(__getitem__=lambda x, idx: 100.0 if idx == -1 else 99.0)
-        )
-        
-        mock_ticker_instance = MagicMock()
-        mock_ticker_instance.history.return_value = mock_hist
-        mock_ticker.return_value = mock_ticker_instance
+        mock_ticker.return_value.history.return_value = _FAKE_HIST
         
         data = self.service.get_market_indices_data()
         
@@ -69,17 +71,7 @@ class TestMarketSentimentService(unittest.TestCase):
     @patch('yfinance.Ticker')
     def test_get_sector_performance(self, mock_ticker):
         """Test: Sector performance fetching"""
-        # Mock yfinance response
-        mock_hist = MagicMock()
-        mock_hist.empty = False
-        mock_hist.__len__ = lambda x: 5
-        mock_hist.__getitem__ = lambda x, key: MagicMock(
-            iloc=MagicMock(__getitem__=lambda x, idx: 100.0 if idx == -1 else 99.0)
-        )
-        
-        mock_ticker_instance = MagicMock()
-        mock_ticker_instance.history.return_value = mock_hist
-        mock_ticker.return_value = mock_ticker_instance
+        mock_ticker.return_value.history.return_value = _FAKE_HIST
         
         data = self.service.get_sector_performance()
         
@@ -189,6 +181,21 @@ class TestMarketSentimentService(unittest.TestCase):
             self.assertIn('sector', rec)
             self.assertIn('price', rec)  # Price field added
     
+    def test_price_range_filtering(self):
+        """Test: Price range filter keeps the original dicts, extra fields included"""
+        recommendations = [
+            {'ticker': 'F', 'reason': 'r', 'sector': 'Consumer Discretionary', 'price': 4.5, 'score': 1},
+            {'ticker': 'T', 'reason': 'r', 'sector': 'Communication', 'price': 18.0, 'score': 2},
+            {'ticker': 'AAPL', 'reason': 'r', 'sector': 'Technology', 'price': 190.0, 'score': 3},
+            {'ticker': 'XYZ', 'reason': 'r', 'sector': 'Technology', 'price': None, 'score': 4},
+        ]
+        
+        self.assertEqual([r['ticker'] for r in self.service._filter_by_price_range(recommendations, '10-25')], ['T'])
+        filtered = self.service._filter_by_price_range(recommendations, '100+')
+        self.assertEqual([r['ticker'] for r in filtered], ['AAPL'])
+        self.assertEqual(filtered[0]['score'], 3)
+        self.assertEqual(self.service._filter_by_price_range(recommendations, 'all'), recommendations)
+    
     def test_cache_save_and_load(self):
         """Test: Cache saving and loading"""
         test_data = {
@@ -212,6 +219,29 @@ class TestMarketSentimentService(unittest.TestCase):
         self.assertEqual(loaded_data['sentiment'], 'BULLISH')
         self.assertEqual(loaded_data['confidence'], 85)
     
+    def test_cache_reads_legacy_json(self):
+        """Test: A JSON cache from before the msgpack switch is still readable"""
+        with open(self.service.legacy_cache_file, 'w') as f:
+            json.dump({'timestamp': datetime.now().isoformat(), 'data': {'sentiment': 'BEARISH'}}, f)
+        
+        loaded_data = self.service.load_cache()
+        
+        self.assertIsNotNone(loaded_data)
+        self.assertEqual(loaded_data['sentiment'], 'BEARISH')
+        
+        # Once a fresh cache is saved it takes precedence over the legacy file
+        self.service.save_cache({'sentiment': 'BULLISH'})
+        self.assertEqual(self.service.load_cache()['sentiment'], 'BULLISH')
+    
+    def test_clear_cache(self):
+        """Test: Clearing the cache forces the next load to miss"""
+        self.service.save_cache({'sentiment': 'BULLISH'})
+        self.service.clear_cache()
+        
+        self.assertIsNone(self.service.load_cache())
+        # Clearing an already-empty cache is a no-op
+        self.service.clear_cache()
+    
     def test_cache_expiration(self):
         """Test: Cache expires after duration"""
         test_data = {
@@ -225,8 +255,7 @@ class TestMarketSentimentService(unittest.TestCase):
             'data': test_data
         }
         
-        os.makedirs(os.path.dirname(self.service.cache_file), exist_ok=True)
-        with open(self.service.cache_file, 'w') as f:
+        with open(self.service.legacy_cache_file, 'w') as f:
             json.dump(old_cache, f)
         
         # Load cache - should return None due to expiration
@@ -247,8 +276,7 @@ class TestMarketSentimentAPI(unittest.TestCase):
     
     def setUp(self):
         """Set up test client"""
-        self.app = create_app()
-        self.app.config['TESTING'] = True
+        self.app = get_test_app()
         self.client = self.app.test_client()
     
     @patch('app.services.market_sentiment_service.MarketSentimentService.get_daily_sentiment')
@@ -5,12 +5,17 @@ Unit and Integration Tests for New Features
 - Ichimoku Cloud indicator
 - Theme parameter flow
 """
+import functools
+import json
 import unittest
 import sys
 import os
 import pandas as pd
 import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,11 +23,66 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.data.data_fetcher import DataFetcher
 from src.utils.technical_analyzer import TechnicalAnalyzer
 from src.utils.chart_generator import ChartGenerator
-from src.web import create_app
+from tests._app import get_test_app
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def _load_price_fixtures(ticker):
+    """Load the offline-generated price history keyed by the (period, interval) Yahoo Finance is asked for"""
+    fixtures = {}
+    prefix = f"{ticker}_"
+    for name in os.listdir(FIXTURES_DIR):
+        if name.startswith(prefix) and name.endswith('.csv'):
+            period, interval = name[len(prefix):-len('.csv')].split('_')
+            path = os.path.join(FIXTURES_DIR, name)
+            fixtures[(period, interval)] = pd.read_csv(path, index_col=0, parse_dates=True)
+    return fixtures
+
+
+@functools.lru_cache(maxsize=None)
+def _aapl(period):
+    """Live AAPL history, fetched at most once per period per test process"""
+    return DataFetcher().fetch_historical_data("AAPL", period=period)
+
+
+def _make_ohlcv(dates, seed=42):
+    """Seeded random-walk OHLCV frame; one RNG draw for all noise columns"""
+    n = len(dates)
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((n, 4))
+    prices = 100 + np.cumsum(noise[:, 0] * 0.5)
+    
+    # Fill one preallocated block so the DataFrame wraps it without consolidation
+    data = np.empty((n, 5), dtype=np.float64)
+    data[:, 0] = prices + noise[:, 1] * 0.1
+    data[:, 1] = prices + np.abs(noise[:, 2]) * 0.3
+    data[:, 2] = prices - np.abs(noise[:, 3]) * 0.3
+    data[:, 3] = prices
+    data[:, 4] = rng.integers(1000, 10000, n)
+    
+    return pd.DataFrame(data, columns=['Open', 'High', 'Low', 'Close', 'Volume'], index=dates, copy=False)
 
 
 class TestIntradayTimeframes(unittest.TestCase):
-    """Test intraday timeframe data fetching"""
+    """Test intraday timeframe data fetching (against offline-generated fixtures)"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Serve Yahoo Finance history from tests/fixtures instead of the network"""
+        cls._fixtures = _load_price_fixtures("AAPL")
+        
+        def fake_ticker(symbol):
+            ticker = MagicMock()
+            ticker.history.side_effect = lambda period, interval: cls._fixtures[(period, interval)].copy()
+            return ticker
+        
+        cls._ticker_patch = patch('src.data.data_fetcher.yf.Ticker', side_effect=fake_ticker)
+        cls._ticker_patch.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls._ticker_patch.stop()
     
     def setUp(self):
         """Set up test fixtures"""
@@ -66,9 +126,14 @@ class TestIntradayTimeframes(unittest.TestCase):
         """Test all intraday timeframes return data"""
         timeframes = ["5m", "15m", "30m", "1h", "3h", "6h", "12h"]
         
-        for timeframe in timeframes:
+        # Fetch all timeframes as one batch (parallel HTTP when run against live data)
+        with ThreadPoolExecutor(max_workers=len(timeframes)) as executor:
+            frames = dict(zip(timeframes, executor.map(
+                lambda tf: self.fetcher.fetch_historical_data(self.test_ticker, period=tf), timeframes
+            )))
+        
+        for timeframe, df in frames.items():
             with self.subTest(timeframe=timeframe):
-                df = self.fetcher.fetch_historical_data(self.test_ticker, period=timeframe)
                 self.assertIsNotNone(df, f"{timeframe} should return data")
                 if df is not None:
                     self.assertFalse(df.empty, f"{timeframe} should not be empty")
@@ -85,42 +150,47 @@ class TestIntradayTimeframes(unittest.TestCase):
         """Test intraday data quality and consistency"""
         df = self.fetcher.fetch_historical_data(self.test_ticker, period="15m")
         
-        # Check for no NaN values in critical columns
-        self.assertFalse(df['Close'].isna().any(), "Close prices should not have NaN")
+        # Check all OHLC invariants in one pass over the array
+        ohlc = df[['Open', 'High', 'Low', 'Close']].to_numpy()
+        high, low, close = ohlc[:, 1], ohlc[:, 2], ohlc[:, 3]
+        valid = (high >= low) & (close <= high) & (close >= low) & ~np.isnan(close)
         
-        # High should be >= Low
-        self.assertTrue((df['High'] >= df['Low']).all(), "High >= Low for all bars")
+        if not valid.all():
+            bad = int(np.argmax(~valid))
+            self.fail(f"OHLC invariant (Low <= Close <= High, no NaN) broken at bar {bad}: {df.iloc[bad].to_dict()}")
+
+
+@pytest.mark.network
+class TestIntradayTimeframesLive(unittest.TestCase):
+    """Fetch real intraday data from Yahoo Finance"""
+    
+    def test_5m_timeframe_live(self):
+        df = _aapl("5m")
         
-        # Close should be between High and Low
-        self.assertTrue((df['Close'] <= df['High']).all(), "Close <= High")
-        self.assertTrue((df['Close'] >= df['Low']).all(), "Close >= Low")
+        self.assertIsNotNone(df)
+        self.assertFalse(df.empty)
+        for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
+            self.assertIn(col, df.columns)
 
 
 class TestVWAPIndicator(unittest.TestCase):
     """Test VWAP (Volume Weighted Average Price) indicator"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create sample OHLCV data once (tests only read it)"""
+        dates = pd.date_range(start='2025-10-01', periods=50, freq='h')
+        cls.df = _make_ohlcv(dates)
+        # Indicators are pure w.r.t. the input frame, so compute them once
+        cls.indicators = TechnicalAnalyzer().calculate_indicators(cls.df)
+    
     def setUp(self):
-        """Create sample data for testing"""
         self.analyzer = TechnicalAnalyzer()
-        
-        # Create sample OHLCV data
-        dates = pd.date_range(start='2025-10-01', periods=50, freq='1H')
-        np.random.seed(42)
-        
-        prices = 100 + np.cumsum(np.random.randn(50) * 0.5)
-        volumes = np.random.randint(1000, 10000, 50)
-        
-        self.df = pd.DataFrame({
-            'Open': prices + np.random.randn(50) * 0.1,
-            'High': prices + abs(np.random.randn(50) * 0.3),
-            'Low': prices - abs(np.random.randn(50) * 0.3),
-            'Close': prices,
-            'Volume': volumes
-        }, index=dates)
+        self.df = type(self).df
     
     def test_vwap_calculation(self):
         """Test VWAP is calculated"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         
         self.assertIsNotNone(indicators, "Indicators should be calculated")
         self.assertIn('VWAP', indicators, "Should have VWAP indicator")
@@ -128,19 +198,20 @@ class TestVWAPIndicator(unittest.TestCase):
     
     def test_vwap_values_reasonable(self):
         """Test VWAP values are within reasonable range"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         vwap = indicators['VWAP']
         
         # VWAP should be close to price range
-        min_price = self.df['Low'].min()
-        max_price = self.df['High'].max()
+        values = vwap.to_numpy()
+        min_price = self.df['Low'].to_numpy().min()
+        max_price = self.df['High'].to_numpy().max()
         
-        self.assertTrue((vwap >= min_price * 0.9).all(), "VWAP should be near price range")
-        self.assertTrue((vwap <= max_price * 1.1).all(), "VWAP should be near price range")
+        self.assertGreaterEqual(values.min(), min_price * 0.9, "VWAP should be near price range")
+        self.assertLessEqual(values.max(), max_price * 1.1, "VWAP should be near price range")
     
     def test_vwap_is_cumulative(self):
         """Test VWAP is cumulative (monotonic or near-monotonic)"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         vwap = indicators['VWAP']
         
         # VWAP should not have large jumps
@@ -153,27 +224,21 @@ class TestVWAPIndicator(unittest.TestCase):
 class TestIchimokuIndicator(unittest.TestCase):
     """Test Ichimoku Cloud indicator components"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create sample data with enough points for Ichimoku, once per class"""
+        dates = pd.date_range(start='2025-07-01', periods=100, freq='D')
+        cls.df = _make_ohlcv(dates)
+        # Indicators are pure w.r.t. the input frame, so compute them once
+        cls.indicators = TechnicalAnalyzer().calculate_indicators(cls.df)
+    
     def setUp(self):
-        """Create sample data for testing"""
         self.analyzer = TechnicalAnalyzer()
-        
-        # Create sample data with enough points for Ichimoku
-        dates = pd.date_range(start='2025-07-01', periods=100, freq='D')
-        np.random.seed(42)
-        
-        prices = 100 + np.cumsum(np.random.randn(100) * 0.5)
-        
-        self.df = pd.DataFrame({
-            'Open': prices + np.random.randn(100) * 0.1,
-            'High': prices + abs(np.random.randn(100) * 0.3),
-            'Low': prices - abs(np.random.randn(100) * 0.3),
-            'Close': prices,
-            'Volume': np.random.randint(1000, 10000, 100)
-        }, index=dates)
+        self.df = type(self).df
     
     def test_ichimoku_components_exist(self):
         """Test all Ichimoku components are calculated"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         
         expected_components = [
             'Ichimoku_tenkan',
@@ -188,26 +253,27 @@ class TestIchimokuIndicator(unittest.TestCase):
     
     def test_tenkan_sen_calculation(self):
         """Test Tenkan-sen (Conversion Line) is calculated correctly"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         tenkan = indicators['Ichimoku_tenkan']
         
         self.assertIsNotNone(tenkan, "Tenkan-sen should be calculated")
         
         # Tenkan should be between high and low of recent period
-        # (with some tolerance for edge cases)
-        self.assertTrue((tenkan >= self.df['Low'].min() * 0.95).all() or tenkan.isna().any())
-        self.assertTrue((tenkan <= self.df['High'].max() * 1.05).all() or tenkan.isna().any())
+        # (with some tolerance for edge cases; warm-up bars are NaN)
+        values = tenkan.to_numpy()
+        self.assertGreaterEqual(np.nanmin(values), self.df['Low'].to_numpy().min() * 0.95)
+        self.assertLessEqual(np.nanmax(values), self.df['High'].to_numpy().max() * 1.05)
     
     def test_kijun_sen_calculation(self):
         """Test Kijun-sen (Base Line) is calculated correctly"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         kijun = indicators['Ichimoku_kijun']
         
         self.assertIsNotNone(kijun, "Kijun-sen should be calculated")
     
     def test_senkou_spans_form_cloud(self):
         """Test Senkou Span A and B form the cloud"""
-        indicators = self.analyzer.calculate_indicators(self.df)
+        indicators = type(self).indicators
         senkou_a = indicators['Ichimoku_senkou_a']
         senkou_b = indicators['Ichimoku_senkou_b']
         
@@ -229,14 +295,15 @@ class TestIchimokuIndicator(unittest.TestCase):
         self.assertIn('Ichimoku_kijun', indicators)
 
 
+@pytest.mark.network
 class TestThemeParameterFlow(unittest.TestCase):
     """Test theme parameter flows through the system"""
     
-    def setUp(self):
-        """Set up test client"""
-        self.app = create_app()
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
+    @classmethod
+    def setUpClass(cls):
+        """Use the shared app; only the test client is per class"""
+        cls.app = get_test_app()
+        cls.client = cls.app.test_client()
     
     def test_analyze_accepts_theme_parameter(self):
         """Test /analyze endpoint accepts theme parameter"""
@@ -272,33 +339,58 @@ class TestThemeParameterFlow(unittest.TestCase):
     
     def test_chart_generator_accepts_theme(self):
         """Test ChartGenerator accepts theme parameter"""
-        fetcher = DataFetcher()
         analyzer = TechnicalAnalyzer()
         generator = ChartGenerator()
         
-        # Fetch data
-        df = fetcher.fetch_historical_data("AAPL", period="1mo")
+        df = _aapl("1mo")
         indicators = analyzer.calculate_indicators(df)
         
-        # Generate charts with both themes
-        for theme in ['dark', 'light']:
-            fig = generator.create_candlestick_chart(
-                "AAPL", df, indicators, 
-                chart_type='candlestick',
-                timeframe='1mo',
-                theme=theme
-            )
-            self.assertIsNotNone(fig, f"Chart should be generated with {theme} theme")
+        # Build the chart once, then restyle it for the other theme
+        fig = generator.create_candlestick_chart(
+            "AAPL", df, indicators, 
+            chart_type='candlestick',
+            timeframe='1mo',
+            theme='dark'
+        )
+        self.assertIsNotNone(fig, "Chart should be generated with dark theme")
+        self.assertEqual(fig.layout.paper_bgcolor, '#111111')
+        
+        ChartGenerator.apply_theme(fig, 'light')
+        self.assertEqual(fig.layout.paper_bgcolor, '#ffffff')
+        self.assertEqual(fig.layout.font.color, '#000000')
 
 
+class TestApplyTheme(unittest.TestCase):
+    """Restyling a built chart must match building it in that theme (synthetic data, offline)"""
+    
+    def _assert_restyle_matches(self, df, indicators):
+        for built, target in [('dark', 'light'), ('light', 'dark')]:
+            with self.subTest(built=built, target=target):
+                fig = ChartGenerator.create_candlestick_chart("TEST", df, indicators, theme=built)
+                ChartGenerator.apply_theme(fig, target)
+                direct = ChartGenerator.create_candlestick_chart("TEST", df, indicators, theme=target)
+                # Compare as JSON so NaN indicator warm-up values compare equal (as null)
+                self.assertEqual(json.loads(fig.to_json()), json.loads(direct.to_json()))
+    
+    def test_restyle_with_indicators(self):
+        df = _make_ohlcv(pd.date_range('2024-01-01', periods=60, freq='D'))
+        self._assert_restyle_matches(df, TechnicalAnalyzer().calculate_indicators(df))
+    
+    def test_restyle_insufficient_data_note(self):
+        """The theme-colored 'insufficient data' note is restyled too"""
+        df = _make_ohlcv(pd.date_range('2024-01-01', periods=10, freq='D'))
+        self._assert_restyle_matches(df, {})
+
+
+@pytest.mark.network
 class TestIntradayIntegration(unittest.TestCase):
     """Integration tests for intraday analysis"""
     
-    def setUp(self):
-        """Set up test client"""
-        self.app = create_app()
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
+    @classmethod
+    def setUpClass(cls):
+        """Use the shared app; only the test client is per class"""
+        cls.app = get_test_app()
+        cls.client = cls.app.test_client()
     
     def test_full_intraday_analysis(self):
         """Test complete analysis with intraday timeframe"""
@@ -2,33 +2,40 @@
 Unit tests for PortfolioAnalyzer newsfeed configuration
 Tests the configurable limits for news and social media
 """
+import copy
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import pandas as pd
 from src.core.portfolio_analyzer import PortfolioAnalyzer
 
+# Minimal price history shared by the tests (never mutated)
+SAMPLE_PRICES = pd.DataFrame({
+    'Close': [100, 101, 102],
+    'Open': [99, 100, 101],
+    'High': [101, 102, 103],
+    'Low': [98, 99, 100],
+    'Volume': [1000, 1100, 1200]
+})
+
 
 class TestNewsfeedConfiguration(unittest.TestCase):
     """Test newsfeed configuration parameters"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the analyzer (and its models) once for the class"""
+        cls._analyzer_tpl = PortfolioAnalyzer(enable_social_media=False)
+    
     def setUp(self):
         """Set up test instance"""
-        self.analyzer = PortfolioAnalyzer(enable_social_media=False)
+        # Shallow copy so per-test data_fetcher swaps don't leak between tests
+        self.analyzer = copy.copy(type(self)._analyzer_tpl)
     
     def test_default_news_limit(self):
         """Test that default news limit is 5"""
-        import pandas as pd
-        
         # Mock the data fetcher with valid data
         mock_fetcher = Mock()
-        # Return a simple DataFrame with price data
-        df = pd.DataFrame({
-            'Close': [100, 101, 102],
-            'Open': [99, 100, 101],
-            'High': [101, 102, 103],
-            'Low': [98, 99, 100],
-            'Volume': [1000, 1100, 1200]
-        })
-        mock_fetcher.fetch_historical_data.return_value = df
+        mock_fetcher.fetch_historical_data.return_value = SAMPLE_PRICES
         mock_fetcher.fetch_news.return_value = []
         mock_fetcher.get_stock_info.return_value = {'name': 'Apple Inc.', 'sector': 'Technology', 'industry': 'Consumer Electronics'}
         self.analyzer.data_fetcher = mock_fetcher
@@ -43,18 +50,9 @@ class TestNewsfeedConfiguration(unittest.TestCase):
     
     def test_custom_news_limit(self):
         """Test that custom news limit is respected"""
-        import pandas as pd
-        
         # Mock the data fetcher with valid data
         mock_fetcher = Mock()
-        df = pd.DataFrame({
-            'Close': [100, 101, 102],
-            'Open': [99, 100, 101],
-            'High': [101, 102, 103],
-            'Low': [98, 99, 100],
-            'Volume': [1000, 1100, 1200]
-        })
-        mock_fetcher.fetch_historical_data.return_value = df
+        mock_fetcher.fetch_historical_data.return_value = SAMPLE_PRICES
         mock_fetcher.fetch_news.return_value = []
         mock_fetcher.get_stock_info.return_value = {'name': 'Apple Inc.', 'sector': 'Technology', 'industry': 'Consumer Electronics'}
         self.analyzer.data_fetcher = mock_fetcher
@@ -154,27 +152,21 @@ class TestNewsfeedLimits(unittest.TestCase):
     
     def test_news_limit_boundary_values(self):
         """Test boundary values for news limit"""
-        import pandas as pd
-        
         analyzer = PortfolioAnalyzer(enable_social_media=False)
         
         # Test various limits
         test_limits = [0, 1, 5, 10, 50, 100]
         
+        # Only max_news varies per iteration; the fetcher is built once
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_historical_data.return_value = SAMPLE_PRICES
+        mock_fetcher.fetch_news.return_value = []
+        mock_fetcher.get_stock_info.return_value = {'name': 'Test', 'sector': 'Test', 'industry': 'Test'}
+        analyzer.data_fetcher = mock_fetcher
+        
         for limit in test_limits:
             with self.subTest(limit=limit):
-                mock_fetcher = Mock()
-                df = pd.DataFrame({
-                    'Close': [100, 101, 102],
-                    'Open': [99, 100, 101],
-                    'High': [101, 102, 103],
-                    'Low': [98, 99, 100],
-                    'Volume': [1000, 1100, 1200]
-                })
-                mock_fetcher.fetch_historical_data.return_value = df
-                mock_fetcher.fetch_news.return_value = []
-                mock_fetcher.get_stock_info.return_value = {'name': 'Test', 'sector': 'Test', 'industry': 'Test'}
-                analyzer.data_fetcher = mock_fetcher
+                mock_fetcher.fetch_news.reset_mock()
                 
                 analyzer.analyze_stock('AAPL', max_news=limit)
                 
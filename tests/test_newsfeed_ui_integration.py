@@ -5,17 +5,24 @@ Tests that the frontend configuration properly connects to backend parameters
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import json
+import types
 import pandas as pd
 
+from tests._fakes import FakeDataFetcher, FakeSentimentAnalyzer, FakeSocialMediaFetcher
+
+# The chart is irrelevant to the forwarding assertions; a constant stands in for the figure
+_FIG = types.SimpleNamespace(to_html=lambda *a, **k: '<div/>')
+
 
 class TestNewsfeedUIIntegration(unittest.TestCase):
     """Test that newsfeed UI configuration reaches the backend correctly"""
     
-    def setUp(self):
-        """Set up test client"""
-        from src.web import create_app
-        self.app = create_app()
-        self.client = self.app.test_client()
+    @classmethod
+    def setUpClass(cls):
+        """Use the shared app; only the test client is per class"""
+        from tests._app import get_test_app
+        cls.app = get_test_app()
+        cls.client = cls.app.test_client()
     
     @patch('src.web.routes.analysis.analysis_service.analyze')
     def test_analyze_endpoint_accepts_newsfeed_params(self, mock_analyze):
@@ -148,6 +155,7 @@ class TestNewsfeedConfigInPortfolioAnalyzer(unittest.TestCase):
     
     @patch('src.core.portfolio_analyzer.DataFetcher')
     @patch('src.core.portfolio_analyzer.SentimentAnalyzer')
+    @patch('src.core.portfolio_analyzer.MultiModelSentimentAnalyzer')
     @patch('src.core.portfolio_analyzer.TechnicalAnalyzer')
     @patch('src.core.portfolio_analyzer.ChartGenerator')
     @patch('src.core.portfolio_analyzer.SocialMediaFetcher')
@@ -155,39 +163,29 @@ class TestNewsfeedConfigInPortfolioAnalyzer(unittest.TestCase):
                                                             mock_social, 
                                                             mock_chart,
                                                             mock_tech,
+                                                            mock_social_sent,
                                                             mock_sent,
                                                             mock_fetcher_class):
         """Test that analyze_portfolio forwards params to analyze_stock"""
         from src.core.portfolio_analyzer import PortfolioAnalyzer
         
-        # Mock data fetcher to return valid DataFrame
-        mock_fetcher = Mock()
-        df = pd.DataFrame({
+        # Plain fakes instead of Mock trees: only the touched attributes exist
+        mock_fetcher_class.return_value = FakeDataFetcher(df=pd.DataFrame({
             'Close': [100, 101, 102],
             'Open': [99, 100, 101],
             'High': [101, 102, 103],
             'Low': [98, 99, 100],
             'Volume': [1000, 1100, 1200]
-        })
-        mock_fetcher.fetch_historical_data.return_value = df
-        mock_fetcher.get_stock_info.return_value = {
-            'name': 'Test Company',
-            'sector': 'Technology',
-            'industry': 'Software'
-        }
-        mock_fetcher.fetch_news.return_value = []
-        mock_fetcher_class.return_value = mock_fetcher
-        
-        # Mock social media fetcher
-        mock_social_instance = Mock()
-        mock_social_instance.fetch_all_social_media.return_value = []
-        mock_social.return_value = mock_social_instance
+        }))
+        social_fetcher = FakeSocialMediaFetcher()
+        mock_social.return_value = social_fetcher
+        mock_sent.return_value = FakeSentimentAnalyzer()
+        mock_social_sent.return_value = FakeSentimentAnalyzer()
         
         # Mock other components
-        mock_sent.return_value = Mock()
         mock_tech.return_value = Mock()
         mock_chart_instance = Mock()
-        mock_chart_instance.create_candlestick_chart.return_value = Mock(to_html=Mock(return_value='<div>Chart</div>'))
+        mock_chart_instance.create_candlestick_chart.return_value = _FIG
         mock_chart.return_value = mock_chart_instance
         
         analyzer = PortfolioAnalyzer(enable_social_media=True)
@@ -204,9 +202,9 @@ class TestNewsfeedConfigInPortfolioAnalyzer(unittest.TestCase):
         )
         
         # Verify social media fetcher was called with max_social
-        mock_social_instance.fetch_all_social_media.assert_called_once()
-        call_args = mock_social_instance.fetch_all_social_media.call_args
-        self.assertEqual(call_args.kwargs['max_per_source'], 18)
+        self.assertEqual(len(social_fetcher.calls), 1)
+        args, kwargs = social_fetcher.calls[0]
+        self.assertEqual(kwargs['max_per_source'], 18)
 
 
 if __name__ == '__main__':
@@ -1,32 +1,97 @@
 #!/usr/bin/env python3
 """
-Test script to verify Selenium can fetch StockTwits data
+Test that the StockTwits JSON API fetch and its Selenium fallback parse StockTwits data
+HTTP responses and the browser are faked with a canned stream, so nothing leaves the machine
 """
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.data.social_media_fetcher as social_media_fetcher
 from src.data.social_media_fetcher import SocialMediaFetcher
 
+# Canned /streams/symbol/{ticker}.json payload
+STREAM = {
+    'messages': [
+        {
+            'id': 1000 + i,
+            'body': f'$HIVE message {i}',
+            'created_at': '2024-01-02T15:00:00Z',
+            'user': {'username': f'user{i}'},
+            'entities': {'sentiment': {'basic': 'Bullish'} if i % 2 == 0 else None},
+        }
+        for i in range(8)
+    ]
+}
+
+
+def _fake_driver(page_text):
+    driver = MagicMock()
+    driver.find_element.return_value.text = page_text
+    return driver
+
+
+@pytest.mark.skipif(not social_media_fetcher.SELENIUM_AVAILABLE, reason="selenium not installed")
 def test_stocktwits_selenium():
-    print("=" * 80)
-    print("Testing StockTwits fetch with Selenium")
-    print("=" * 80)
-    
     fetcher = SocialMediaFetcher()
-    ticker = "HIVE"
-    
-    print(f"\n📊 Fetching StockTwits data for {ticker}...")
-    messages = fetcher.fetch_stocktwits_messages(ticker, max_messages=5)
-    
-    print(f"\n✅ Retrieved {len(messages)} messages")
-    
-    if messages:
-        print("\n📝 Sample messages:")
-        for i, msg in enumerate(messages[:3], 1):
-            print(f"\n{i}. {msg.get('source', 'Unknown')} - {msg.get('user', 'Unknown')}")
-            print(f"   {msg.get('text', '')[:150]}...")
-            print(f"   Link: {msg.get('link', 'N/A')}")
-    else:
-        print("\n❌ No messages retrieved")
-    
-    print("\n" + "=" * 80)
+    driver = _fake_driver(json.dumps(STREAM))
+
+    with patch.object(social_media_fetcher.webdriver, 'Chrome', return_value=driver):
+        messages = fetcher.fetch_stocktwits_with_selenium("HIVE", max_messages=5)
+
+    assert len(messages) == 5
+    first = messages[0]
+    assert first['source'] == 'StockTwits'
+    assert first['user'] == 'user0'
+    assert first['link'] == 'https://stocktwits.com/message/1000'
+    assert first['user_sentiment'] == 'Bullish'
+    assert 'user_sentiment' not in messages[1]
+    driver.quit.assert_called_once()
+
+
+@pytest.mark.skipif(not social_media_fetcher.SELENIUM_AVAILABLE, reason="selenium not installed")
+def test_stocktwits_selenium_blocked_page():
+    """A Cloudflare page instead of JSON yields no messages"""
+    fetcher = SocialMediaFetcher()
+    driver = _fake_driver('Just a moment...')
+
+    with patch.object(social_media_fetcher.webdriver, 'Chrome', return_value=driver):
+        assert fetcher.fetch_stocktwits_with_selenium("HIVE", max_messages=5) == []
+
+
+
+def _fake_response(status_code, payload=None):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = payload
+    return response
+
+
+def test_stocktwits_json_api():
+    """The plain HTTP fetch parses the stream without starting a browser"""
+    fetcher = SocialMediaFetcher()
+
+    with patch.object(fetcher.session, 'get', return_value=_fake_response(200, STREAM)) as get, \
+            patch.object(fetcher, 'fetch_stocktwits_with_selenium') as selenium_fetch:
+        messages = fetcher.fetch_stocktwits_messages("HIVE", max_messages=5)
+
+    assert get.call_args.args[0] == 'https://api.stocktwits.com/api/2/streams/symbol/HIVE.json'
+    assert len(messages) == 5
+    assert messages[0]['link'] == 'https://stocktwits.com/message/1000'
+    selenium_fetch.assert_not_called()
+
+
+def test_stocktwits_json_api_blocked_falls_back_to_selenium():
+    """Only a Cloudflare 403 on the JSON API starts the browser"""
+    fetcher = SocialMediaFetcher()
+
+    with patch.object(fetcher.session, 'get', return_value=_fake_response(403)), \
+            patch.object(social_media_fetcher, 'SELENIUM_AVAILABLE', True), \
+            patch.object(fetcher, 'fetch_stocktwits_with_selenium', return_value=['fallback']) as selenium_fetch:
+        assert fetcher.fetch_stocktwits_messages("HIVE", max_messages=5) == ['fallback']
+
+    selenium_fetch.assert_called_once_with("HIVE", 5)
+
 
 if __name__ == "__main__":
-    test_stocktwits_selenium()
+    pytest.main([__file__, '-v', '-s'])
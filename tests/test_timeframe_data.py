@@ -1,33 +1,87 @@
 """
 Debug: Verify that timeframe data is being fetched correctly
+Yahoo Finance is replaced by offline-generated XRP-EUR daily candles (tests/fixtures).
+DataFetcher sends XRP-EUR itself to CoinGecko, so the candles are served as the Yahoo
+history of a stock symbol.
 """
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
 import yfinance as yf
 
+from src.data.data_fetcher import DataFetcher
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Calendar span covered by each yfinance period (the fixture has a candle every day)
+PERIOD_OFFSETS = {
+    '1d': pd.DateOffset(days=1),
+    '5d': pd.DateOffset(days=5),
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+}
+
+
+def _fake_ticker(candles):
+    """yf.Ticker stand-in serving the trailing period of the daily candles, like Yahoo"""
+    def history(period, interval):
+        if interval != '1d':
+            return candles.iloc[:0]  # only daily candles are recorded
+        start = candles.index[-1] - PERIOD_OFFSETS[period]
+        return candles[candles.index > start].copy()
+
+    ticker = MagicMock()
+    ticker.history.side_effect = history
+    return ticker
+
+
 def test_timeframe_data():
     """
     Test that different timeframes return appropriate data
+    DataFetcher picks the Yahoo period/interval per timeframe and returns the candles as served
     """
-    ticker = "XRP-EUR"
-    timeframes = ['1d', '5d', '1mo', '3mo']
-    
+    ticker = "AAPL"
+    candles = pd.read_csv(os.path.join(FIXTURES_DIR, 'XRP-EUR_3mo_1d.csv'), index_col=0, parse_dates=True)
+    last = candles.index[-1]
+    fetcher = DataFetcher()
+
     print(f"\n{'='*70}")
     print(f"TESTING: Timeframe Data Fetching for {ticker}")
     print(f"{'='*70}\n")
-    
-    for timeframe in timeframes:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=timeframe)
-        
-        if not hist.empty:
+
+    # timeframe -> (expected yfinance interval, expected candles)
+    expected = {
+        '1d': ('30m', 0),  # intraday bars for one day; no such fixture, so no data
+        '5d': ('1d', 5),
+        '1mo': ('1d', 30),
+        '3mo': ('1d', len(candles)),
+    }
+
+    for timeframe, (interval, rows) in expected.items():
+        fake = _fake_ticker(candles)
+        with patch.object(yf, 'Ticker', return_value=fake):
+            hist = fetcher.fetch_historical_data(ticker, period=timeframe)
+
+        fake.history.assert_called_once_with(period=timeframe, interval=interval)
+
+        if hist is not None:
             start_price = hist['Close'].iloc[0]
             end_price = hist['Close'].iloc[-1]
             change = ((end_price - start_price) / start_price) * 100
-            
+
             print(f"Timeframe: {timeframe:5} | Candles: {len(hist):3} | Change: {change:+7.2f}%")
-            print(f"  Start: €{start_price:.4f} | End: €{end_price:.4f}")
+            print(f"  Start: {start_price:.4f} | End: {end_price:.4f}")
         else:
             print(f"Timeframe: {timeframe:5} | NO DATA")
-    
+
+        if rows == 0:
+            assert hist is None
+            continue
+        assert len(hist) == rows
+        assert hist.index[-1] == last
+        assert hist.index[0] == last - PERIOD_OFFSETS[timeframe] + pd.Timedelta(days=1)
+
     print(f"\n{'='*70}\n")
 
 if __name__ == "__main__":
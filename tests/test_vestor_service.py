@@ -4,104 +4,68 @@ Tests the core chatbot conversation logic
 """
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-from src.web.services.vestor_service import VestorService
 
+import pytest
 
-class TestVestorServiceGreetings(unittest.TestCase):
-    """Test greeting detection and responses"""
-    
-    def setUp(self):
-        """Initialize VestorService for each test"""
-        self.vestor = VestorService()
-    
-    def test_greeting_hello(self):
-        """Test that 'hello' triggers greeting response"""
-        result = self.vestor.process_chat(
-            question="hello",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('Vestor', result['answer'])
-        self.assertIn('financial advisor', result['answer'].lower())
-        self.assertEqual(result['vestor_mode'], 'conversation')
-    
-    def test_greeting_hi(self):
-        """Test that 'hi' triggers greeting response"""
-        result = self.vestor.process_chat(
-            question="hi",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('Vestor', result['answer'])
-    
-    def test_greeting_hey_there(self):
-        """Test that 'hey there' triggers greeting response"""
-        result = self.vestor.process_chat(
-            question="hey there",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('Vestor', result['answer'])
-    
-    def test_greeting_case_insensitive(self):
-        """Test that greetings are case insensitive"""
-        result = self.vestor.process_chat(
-            question="HELLO",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('Vestor', result['answer'])
+from src.web.services.vestor_service import VestorService, lookup_company_ticker
+
+
+@pytest.fixture
+def service(vestor, chat):
+    """The session VestorService (conftest) with per-test state cleared"""
+    # `chat` resets the shared assistant's conversation memory
+    vestor._analysis_contexts.clear()
+    return vestor
 
 
-class TestVestorServiceThankYou(unittest.TestCase):
-    """Test thank you message handling"""
+class VestorTestCase(unittest.TestCase):
+    """
+    Runs against the session VestorService with per-test state cleared
+    The service comes from a pytest fixture, so run these classes with pytest
+    """
     
-    def setUp(self):
-        self.vestor = VestorService()
+    @pytest.fixture(autouse=True)
+    def _vestor(self, service):
+        self.vestor = service
+
+
+@pytest.mark.parametrize('question, needle', [
+    ("hello", 'Vestor'),
+    ("hi", 'Vestor'),
+    ("hey there", 'Vestor'),
+    ("HELLO", 'Vestor'),  # greetings are case insensitive
+    ("thank you", 'welcome'),
+    ("thanks", 'welcome'),
+])
+def test_small_talk(service, question, needle):
+    """Greetings introduce Vestor and thanks get a 'you're welcome', in conversation mode"""
+    result = service.process_chat(
+        question=question,
+        ticker="",
+        context_ticker="",
+        conversation_history=[]
+    )
     
-    def test_thank_you(self):
-        """Test 'thank you' response"""
-        result = self.vestor.process_chat(
-            question="thank you",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('welcome', result['answer'].lower())
+    assert result['success']
+    assert needle.lower() in result['answer'].lower()
+    assert result['vestor_mode'] == 'conversation'
+
+
+def test_greeting_introduces_advisor(service):
+    """Test that 'hello' describes Vestor as a financial advisor"""
+    result = service.process_chat(
+        question="hello",
+        ticker="",
+        context_ticker="",
+        conversation_history=[]
+    )
     
-    def test_thanks(self):
-        """Test 'thanks' response"""
-        result = self.vestor.process_chat(
-            question="thanks",
-            ticker="",
-            context_ticker="",
-            conversation_history=[]
-        )
-        
-        self.assertTrue(result['success'])
-        self.assertIn('welcome', result['answer'].lower())
+    assert 'financial advisor' in result['answer'].lower()
 
 
-class TestVestorServiceTickerDetection(unittest.TestCase):
+class TestVestorServiceTickerDetection(VestorTestCase):
     """Test ticker symbol and company name detection"""
     
-    def setUp(self):
-        self.vestor = VestorService()
-    
     def test_detect_ticker_aapl(self):
         """Test detection of AAPL ticker"""
         tickers = self.vestor._detect_tickers("What about AAPL?", "what about aapl?")
@@ -131,13 +95,29 @@ class TestVestorServiceTickerDetection(unittest.TestCase):
         self.assertIn('AAPL', tickers)
         self.assertIn('MSFT', tickers)
 
+    def test_detect_longest_company_name_once(self):
+        """Test overlapping names resolve to the longest one"""
+        tickers = self.vestor._detect_tickers(
+            "Lockheed Martin or Apple?",
+            "lockheed martin or apple?"
+        )
+        self.assertCountEqual(tickers, ['LMT', 'AAPL'])
+    
+    def test_detect_overlapping_company_names(self):
+        """Names sharing words are all detected, as with a scan per company name"""
+        tickers = self.vestor._detect_tickers("jp morgan stanley", "jp morgan stanley")
+        self.assertCountEqual(tickers, ['JPM', 'MS'])
+    
+    def test_company_priority_ignores_mention_order(self):
+        """The first detected ticker follows the company table, not word order"""
+        for question in ("Microsoft or Apple?", "Apple or Microsoft?"):
+            tickers = self.vestor._detect_tickers(question, question.lower())
+            self.assertEqual(tickers, ['AAPL', 'MSFT'])
+
 
-class TestVestorServiceTickerResolution(unittest.TestCase):
+class TestVestorServiceTickerResolution(VestorTestCase):
     """Test ticker resolution logic"""
     
-    def setUp(self):
-        self.vestor = VestorService()
-    
     def test_explicit_ticker_priority(self):
         """Test that explicit ticker has highest priority"""
         result = self.vestor._resolve_ticker(
@@ -179,12 +159,9 @@ class TestVestorServiceTickerResolution(unittest.TestCase):
         self.assertIsNone(result)
 
 
-class TestVestorServiceResponseFormat(unittest.TestCase):
+class TestVestorServiceResponseFormat(VestorTestCase):
     """Test that responses are properly formatted"""
     
-    def setUp(self):
-        self.vestor = VestorService()
-    
     def test_response_has_answer_string(self):
         """Test that response contains 'answer' key with string value"""
         result = self.vestor.process_chat(
@@ -223,12 +200,9 @@ class TestVestorServiceResponseFormat(unittest.TestCase):
         self.assertIsInstance(result['vestor_mode'], str)
 
 
-class TestVestorServiceFallbackResponse(unittest.TestCase):
+class TestVestorServiceFallbackResponse(VestorTestCase):
     """Test fallback responses when AI fails"""
     
-    def setUp(self):
-        self.vestor = VestorService()
-    
     def test_fallback_response_structure(self):
         """Test fallback response has correct structure"""
         result = self.vestor._fallback_response()
@@ -240,5 +214,73 @@ class TestVestorServiceFallbackResponse(unittest.TestCase):
         self.assertIn('Vestor', result['answer'])
 
 
+class TestVestorServiceAnalysisContext(VestorTestCase):
+    """Test reuse of the analysis context across follow-up questions"""
+    
+    def setUp(self):
+        self.result = {'current_price': 175.5, 'price_change': 2.1, 'recommendation': 'BUY',
+                       'reasons': ['Strong momentum']}
+    
+    def test_context_reused_for_same_analysis(self):
+        """Same cached analysis returns the same context object"""
+        first = self.vestor._get_analysis_context('AAPL', self.result)
+        second = self.vestor._get_analysis_context('AAPL', self.result)
+        
+        self.assertIs(first, second)
+        self.assertIn('$175.50', first)
+        self.assertIn('- Strong momentum', first)
+    
+    def test_context_rebuilt_after_fresh_analysis(self):
+        """A new analysis result for the ticker invalidates the stored context"""
+        self.vestor._get_analysis_context('AAPL', self.result)
+        fresh = dict(self.result, current_price=180.0)
+        
+        self.assertIn('$180.00', self.vestor._get_analysis_context('AAPL', fresh))
+    
+    def test_least_recently_used_context_evicted(self):
+        """Only ANALYSIS_CONTEXT_CACHE_SIZE tickers are kept; the least recently used goes first"""
+        size = self.vestor.ANALYSIS_CONTEXT_CACHE_SIZE
+        tickers = [f'T{i}' for i in range(size + 1)]
+        for ticker in tickers[:size]:
+            self.vestor._get_analysis_context(ticker, self.result)
+        self.vestor._get_analysis_context('T0', self.result)  # touch the oldest
+        self.vestor._get_analysis_context(tickers[-1], self.result)
+        
+        self.assertEqual(len(self.vestor._analysis_contexts), size)
+        self.assertIn('T0', self.vestor._analysis_contexts)
+        self.assertNotIn('T1', self.vestor._analysis_contexts)
+
+
+class TestVestorServiceTickerLookup(VestorTestCase):
+    """Test answering "what's the ticker for ..." questions"""
+    
+    def test_known_company_with_suffix(self):
+        """Suffixes like 'stock' are stripped before the lookup"""
+        question = "what's the ticker for boeing stock?"
+        result = self.vestor._handle_ticker_lookup(question, question.lower())
+        
+        self.assertEqual(result['ticker'], 'BA')
+        self.assertEqual(result['vestor_mode'], 'ticker_lookup')
+    
+    def test_longest_company_prefix(self):
+        """Trailing words after a known company name still resolve, preferring the longest name"""
+        self.assertEqual(lookup_company_ticker('boeing shares'), ('boeing', 'BA'))
+        self.assertEqual(lookup_company_ticker('goldman sachs group'), ('goldman sachs', 'GS'))
+    
+    def test_unknown_company(self):
+        question = "what's the ticker for random startup"
+        result = self.vestor._handle_ticker_lookup(question, question.lower())
+        
+        self.assertIsNone(result['ticker'])
+        self.assertEqual(result['vestor_mode'], 'ticker_lookup_not_found')
+    
+    def test_lookup_is_memoized(self):
+        """Repeated company phrases are resolved from the cache"""
+        lookup_company_ticker.cache_clear()
+        self.assertEqual(lookup_company_ticker('goldman sachs'), ('goldman sachs', 'GS'))
+        self.assertEqual(lookup_company_ticker('goldman sachs'), ('goldman sachs', 'GS'))
+        self.assertEqual(lookup_company_ticker.cache_info().hits, 1)
+
+
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__, '-v'])